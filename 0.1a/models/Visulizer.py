@@ -1,46 +1,73 @@
 import os
+import re
+import sys
 import json
 import tkinter as tk
 from tkinter import filedialog, messagebox
-import networkx as nx
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import textwrap
-import mplcursors
+from functools import lru_cache
+from itertools import zip_longest
+
+# networkx / matplotlib / mplcursors are imported on first use so the
+# window can open before the plotting stack has loaded.
+nx = None
+np = None
+plt = None
+FigureCanvasTkAgg = None
+mplcursors = None
+
+def _import_graph_libs():
+    global nx
+    if nx is None:
+        import networkx
+        nx = networkx
+
+def _import_plot_libs():
+    global np, plt, FigureCanvasTkAgg, mplcursors
+    if plt is None:
+        import numpy
+        import matplotlib.pyplot as pyplot
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg as canvas_cls
+        import mplcursors as cursors
+        np, plt, FigureCanvasTkAgg, mplcursors = numpy, pyplot, canvas_cls, cursors
 
 # ---------------- Adjustable Parameters ---------------- #
 wrap_width = 6        # max characters per line inside node
 max_lines = 3         # max lines shown inside node
+label_cap = 150       # labels are hidden when more nodes than this are in view
+stroke_cap = 500      # node outlines are skipped above this many nodes
+resize_slack = 16     # px a resize may differ from the last render before redrawing
 
 # ---------------- Graph Building ---------------- #
 def build_graph(data):
+    _import_graph_libs()
     G = nx.DiGraph()
     root = data.get("name", "Chatbot")
-    G.add_node(root, layer=0, type="root", full_text=root)
+    G.add_node(root, layer=0, type="root", full_text=sys.intern(str(root)))
 
     for gi, group in enumerate(data.get("qa_groups", []), start=1):
         group_node = f"Group: {group['group_name']}"
-        G.add_node(group_node, layer=1, type="group", full_text=group_node)
+        G.add_node(group_node, layer=1, type="group", full_text=sys.intern(group_node))
         G.add_edge(root, group_node)
 
         for q in group.get("questions", []):
             q_node = f"Q: {q}"
-            G.add_node(q_node, layer=2, type="question", full_text=q)
+            G.add_node(q_node, layer=2, type="question", full_text=sys.intern(str(q)))
             G.add_edge(group_node, q_node)
 
         for a in group.get("answers", []):
             a_node = f"A: {a}"
-            G.add_node(a_node, layer=3, type="answer", full_text=a)
+            G.add_node(a_node, layer=3, type="answer", full_text=sys.intern(str(a)))
             G.add_edge(group_node, a_node)
 
         def add_followups(followups, parent, depth):
             for f in followups:
                 f_node = f"Follow: {f['question']}"
-                G.add_node(f_node, layer=depth, type="followup", full_text=f['question'])
+                G.add_node(f_node, layer=depth, type="followup", full_text=sys.intern(str(f['question'])))
                 G.add_edge(parent, f_node)
 
                 a_node = f"A: {f['answer']}"
-                G.add_node(a_node, layer=depth+1, type="answer", full_text=f['answer'])
+                G.add_node(a_node, layer=depth+1, type="answer", full_text=sys.intern(str(f['answer'])))
                 G.add_edge(f_node, a_node)
 
                 add_followups(f.get("children", []), f_node, depth+1)
@@ -50,9 +77,17 @@ def build_graph(data):
     return G
 
 # ---------------- Layout ---------------- #
+_WRAP_RE = re.compile(r'.{1,%d}' % wrap_width)
+_BREAK_RE = re.compile(r'[\s-]')  # characters textwrap may break on
+
+@lru_cache(maxsize=4096)
 def wrap_and_truncate(text, width=wrap_width, max_lines=max_lines):
     """Wrap text and truncate with ... if too many lines."""
-    lines = textwrap.wrap(text, width=width)
+    if width == wrap_width and not _BREAK_RE.search(text):
+        # Single unbroken word: textwrap would just chop it into width-sized pieces
+        lines = _WRAP_RE.findall(text)
+    else:
+        lines = textwrap.wrap(text, width=width)
     if len(lines) > max_lines:
         lines = lines[:max_lines]
         lines[-1] += "..."
@@ -88,8 +123,11 @@ def custom_layout_scaled(G):
     return pos
 
 # ---------------- Visualization ---------------- #
-def visualize_graph(G, canvas_frame):
-    fig, ax = plt.subplots(figsize=(18, 10))
+def visualize_graph(G, ax, canvas):
+    """Redraw G on an existing axes/canvas and return the hover cursor."""
+    _import_graph_libs()
+    _import_plot_libs()
+    ax.cla()
     pos = custom_layout_scaled(G)
 
     color_map = {
@@ -103,26 +141,56 @@ def visualize_graph(G, canvas_frame):
     node_sizes = [1500 for _ in G.nodes]  # uniform node size
     labels = wrap_labels(G)
 
-    nx.draw_networkx_nodes(G, pos, node_size=node_sizes, node_color=node_colors, edgecolors="black", ax=ax)
+    edgecolors = "black" if G.number_of_nodes() <= stroke_cap else "none"
+    nx.draw_networkx_nodes(G, pos, node_size=node_sizes, node_color=node_colors, edgecolors=edgecolors, ax=ax)
     nx.draw_networkx_edges(G, pos, arrowstyle="->", arrowsize=15, alpha=0.6, ax=ax)
-    nx.draw_networkx_labels(G, pos, labels=labels, font_size=8, font_family="sans-serif", ax=ax)
+
+    # Level-of-detail labels: a fixed pool of Text artists is reused for
+    # whichever nodes are inside the current view.
+    coords = np.array([pos[n] for n in G.nodes], dtype=float).reshape(-1, 2)
+    label_texts = [labels[n] for n in G.nodes]
+    text_pool = [
+        ax.text(0, 0, "", fontsize=8, family="sans-serif",
+                ha="center", va="center", clip_on=True, visible=False)
+        for _ in range(min(label_cap, len(label_texts)))
+    ]
+
+    def on_zoom(ax):
+        xmin, xmax = sorted(ax.get_xlim())
+        ymin, ymax = sorted(ax.get_ylim())
+        mask = ((coords[:, 0] >= xmin) & (coords[:, 0] <= xmax) &
+                (coords[:, 1] >= ymin) & (coords[:, 1] <= ymax))
+        visible = np.flatnonzero(mask)
+        if len(visible) > label_cap:
+            visible = visible[:0]  # zoomed out too far, labels would be unreadable
+        for text, idx in zip_longest(text_pool, visible):
+            if text is None:
+                break
+            if idx is None:
+                text.set_visible(False)
+                continue
+            text.set_text(label_texts[idx])
+            text.set_position(coords[idx])
+            text.set_visible(True)
+
+    ax.callbacks.connect("xlim_changed", on_zoom)
+    ax.callbacks.connect("ylim_changed", on_zoom)
 
     ax.set_title("Rule-Based Chatbot as Neural Network", fontsize=18)
     ax.axis("off")
+    on_zoom(ax)
 
     # Hover tooltips for full text
+    nodes_ordered = list(G.nodes)  # same order as the node PathCollection offsets
     cursor = mplcursors.cursor(ax.collections, hover=True)
-    def show_text(sel):
-        node_idx = sel.index
-        node = list(G.nodes)[node_idx]
-        full_text = G.nodes[node]['full_text']
+    def show_text(sel, _nodes=nodes_ordered, _G=G):
+        node = _nodes[sel.index]
+        full_text = _G.nodes[node]['full_text']
         sel.annotation.set_text(full_text)
     cursor.connect("add", show_text)
 
-    # Embed in Tkinter
-    canvas = FigureCanvasTkAgg(fig, master=canvas_frame)
-    canvas.draw()
-    canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+    canvas.draw_idle()
+    return cursor
 
 # ---------------- GUI ---------------- #
 class ChatbotVisualizer(tk.Tk):
@@ -143,6 +211,29 @@ class ChatbotVisualizer(tk.Tk):
         self.canvas_frame = tk.Frame(self)
         self.canvas_frame.pack(fill=tk.BOTH, expand=True)
 
+        # Figure and Tk canvas are built on the first load and reused afterwards
+        self.fig = self.ax = self.canvas = None
+        self.cursor = None
+        self._pix_size = None  # widget size the current render was made for
+
+    def ensure_canvas(self):
+        if self.canvas is None:
+            _import_plot_libs()
+            self.fig, self.ax = plt.subplots(figsize=(18, 10))
+            self.canvas = FigureCanvasTkAgg(self.fig, master=self.canvas_frame)
+            widget = self.canvas.get_tk_widget()
+            widget.bind("<Configure>", self.on_resize)  # replaces the backend's resize binding
+            widget.pack(fill=tk.BOTH, expand=True)
+
+    def on_resize(self, event):
+        """Keep showing the last rendered image for small resizes."""
+        if self._pix_size is not None:
+            w, h = self._pix_size
+            if abs(event.width - w) < resize_slack and abs(event.height - h) < resize_slack:
+                return
+        self._pix_size = (event.width, event.height)
+        self.canvas.resize(event)
+
     def load_json(self):
         filepath = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
         if not filepath:
@@ -150,11 +241,12 @@ class ChatbotVisualizer(tk.Tk):
         try:
             with open(filepath, "r") as f:
                 data = json.load(f)
-            # Clear previous canvas
-            for widget in self.canvas_frame.winfo_children():
-                widget.destroy()
             G = build_graph(data)
-            visualize_graph(G, self.canvas_frame)
+            self.ensure_canvas()
+            if self.cursor is not None:
+                self.cursor.remove()
+            self._pix_size = None
+            self.cursor = visualize_graph(G, self.ax, self.canvas)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load JSON:\n{e}")
 
@@ -1,9 +1,84 @@
+import bisect
 import json
 import os
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog, simpledialog
 import datetime
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _loads(raw):
+    """Parse JSON from bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _dumps(data, pretty=True):
+    """Serialize data to UTF-8 JSON bytes, indented unless pretty is False"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+# Single worker so file reads/writes run off the Tk thread but stay in order
+_IO_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="train-io")
+
+def run_in_background(widget, func, on_done, poll_ms=20):
+    """Run func on the I/O pool; the Tk thread polls for it and calls on_done(result, error)
+
+    func must only work on data it owns, never on state the Tk thread keeps using.
+    """
+    future = _IO_POOL.submit(func)
+    
+    def check():
+        if not future.done():
+            widget.after(poll_ms, check)
+            return
+        error = future.exception()
+        on_done(None if error else future.result(), error)
+    
+    # Scheduled from the Tk thread, so the worker never touches Tk itself
+    widget.after(poll_ms, check)
+    return future
+
+def _read_import_file(filename):
+    """Parse an import file into QA group dicts"""
+    with open(filename, 'rb') as f:
+        data = _loads(f.read())
+    
+    # Handle both array format and object format
+    if isinstance(data, list):
+        imported_groups = data
+    else:
+        imported_groups = [data]
+    
+    return [{
+        'group_name': qa.get('group_name', f"Imported {i+1}"),
+        'group_description': qa.get('group_description', "Imported from JSON"),
+        'questions': qa.get('questions', []),
+        'answers': qa.get('answers', []),
+        'topic': qa.get('topic', 'general'),
+        'priority': qa.get('priority', 'medium'),
+        'follow_ups': qa.get('follow_ups', [])
+    } for i, qa in enumerate(imported_groups)]
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+# Fields written per group on export; only the optional ones have defaults
+EXPORT_KEYS = ('group_name', 'group_description', 'questions', 'answers', 'topic', 'priority', 'follow_ups')
+EXPORT_DEFAULTS = {'group_description': '', 'follow_ups': []}
+
+def _write_export_file(filename, payload):
+    with open(filename, 'wb') as f:
+        f.write(payload)
 
 class ModelManager:
     def __init__(self, parent, on_model_change=None):
@@ -12,6 +87,7 @@ class ModelManager:
         self.models_folder = "models"
         self.current_model = None
         self.available_models = []
+        self._model_headers = {}  # model name -> (file st_mtime_ns, metadata last read or written, groups left out)
         
         # Create models folder if it doesn't exist
         os.makedirs(self.models_folder, exist_ok=True)
@@ -30,6 +106,14 @@ class ModelManager:
         # Sort models alphabetically
         self.available_models.sort()
     
+    def _remember_header(self, name, model_data, mtime=None):
+        """Cache the metadata of a model file; mtime defaults to the file's current one"""
+        if mtime is None:
+            mtime = os.stat(self.get_model_path(name)).st_mtime_ns
+        header = dict(model_data)
+        header['qa_groups'] = []  # keeps the key order without holding the groups
+        self._model_headers[name] = (mtime, header)
+    
     def get_model_path(self, model_name):
         """Get the full path for a model file"""
         return os.path.join(self.models_folder, f"{model_name}.json")
@@ -56,9 +140,10 @@ class ModelManager:
         model_path = self.get_model_path(name)
         with open(model_path, 'w', encoding='utf-8') as f:
             json.dump(model_data, f, indent=2)
+        self._remember_header(name, model_data)
         
-        # Refresh available models
-        self.load_available_models()
+        # The list is already sorted; add the new name instead of re-listing the folder
+        bisect.insort(self.available_models, name)
         
         # Set as current model
         self.current_model = name
@@ -71,8 +156,11 @@ class ModelManager:
             raise ValueError(f"Model '{name}' not found")
         
         model_path = self.get_model_path(name)
+        # Taken before reading, so a write that lands mid-read only causes a re-read later
+        mtime = os.stat(model_path).st_mtime_ns
         with open(model_path, 'r', encoding='utf-8') as f:
             model_data = json.load(f)
+        self._remember_header(name, model_data, mtime)
         
         self.current_model = name
         
@@ -100,6 +188,7 @@ class ModelManager:
         # Save updated model
         with open(model_path, 'w', encoding='utf-8') as f:
             json.dump(model_data, f, indent=2)
+        self._remember_header(name, model_data)
         
         return model_data
     
@@ -107,8 +196,17 @@ class ModelManager:
         """Save QA groups to a model"""
         model_path = self.get_model_path(name)
         
-        # Load existing model data or create new
-        if os.path.exists(model_path):
+        # Reuse the metadata from the last load or save rather than re-reading
+        # and re-parsing the whole file, old groups included, on every edit;
+        # the file is read again if something else has changed it since
+        try:
+            mtime = os.stat(model_path).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        cached = self._model_headers.get(name)
+        if cached is not None and cached[0] == mtime:
+            model_data = dict(cached[1])
+        elif mtime is not None:
             with open(model_path, 'r', encoding='utf-8') as f:
                 model_data = json.load(f)
         else:
@@ -128,6 +226,7 @@ class ModelManager:
         # Save model file
         with open(model_path, 'w', encoding='utf-8') as f:
             json.dump(model_data, f, indent=2)
+        self._remember_header(name, model_data)
         
         return model_data
     
@@ -138,7 +237,8 @@ class ModelManager:
         
         model_path = self.get_model_path(name)
         os.remove(model_path)
-        self.load_available_models()
+        self.available_models.remove(name)
+        self._model_headers.pop(name, None)
         
         # If we deleted the current model, clear it
         if self.current_model == name:
@@ -1384,15 +1484,13 @@ class GroupEditor:
         container.columnconfigure(1, weight=1)
         container.rowconfigure(0, weight=1)
         
-        questions_frame = self.create_qa_subsection(container, "Questions", 
-                                                  self.add_question, self.edit_question, self.delete_question)
+        questions_frame, self.questions_list = self.create_qa_subsection(
+            container, "Questions", self.add_question, self.edit_question, self.delete_question)
         questions_frame.grid(row=0, column=0, sticky='nsew', padx=(0, 5))
-        self.questions_list = questions_frame.winfo_children()[1].winfo_children()[0]
         
-        answers_frame = self.create_qa_subsection(container, "Answers",
-                                                self.add_answer, self.edit_answer, self.delete_answer)
+        answers_frame, self.answers_list = self.create_qa_subsection(
+            container, "Answers", self.add_answer, self.edit_answer, self.delete_answer)
         answers_frame.grid(row=0, column=1, sticky='nsew', padx=(5, 0))
-        self.answers_list = answers_frame.winfo_children()[1].winfo_children()[0]
         
         return container
     
@@ -1466,7 +1564,7 @@ class GroupEditor:
             width=8
         ).pack(side=tk.LEFT)
         
-        return frame
+        return frame, listbox
     
     def setup_settings(self, parent):
         frame = tk.Frame(parent, bg='#252547', relief='raised', bd=1, padx=10, pady=10)
@@ -1699,6 +1797,10 @@ class GroupEditor:
         self.window.destroy()
 
 class TrainingGUI:
+    # Group cards are fixed-height rows so the visible range can be computed
+    CARD_HEIGHT = 86
+    ROW_PITCH = CARD_HEIGHT + 8
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Edgar AI Training")
@@ -1708,12 +1810,25 @@ class TrainingGUI:
         
         self.current_model = None
         self.qa_groups = []
-        self.scroll_frame = None
+        self.search_index = []  # lowercased (name, description) per group
+        self.trigram_index = None  # per field: trigram -> group indices, built on demand
+        self.totals = {'questions': 0, 'answers': 0}
+        self.followup_counts = []  # follow-up tree size per group
+        self.canvas = None
+        self.filtered_groups = []  # qa_groups indices matching the search
+        self.visible_cards = {}  # row -> card widgets
+        self.card_pool = []  # hidden cards kept for reuse
         self.model_changing = False  # Flag to prevent recursion
+        self._search_after_id = None
+        self._pending_scroll = 0
+        self._scroll_after_id = None
+        self._needs_refresh = False
+        self._dirty = False  # groups changed since the last load or save
         
         self.model_manager = ModelManager(root)
         
-        self.configure_ttk_styles()
+        # Styles are applied once the window is idle so it can paint first
+        self.root.after_idle(self.configure_ttk_styles)
         self.setup_gui()
         
         if not self.model_manager.available_models:
@@ -1770,8 +1885,8 @@ class TrainingGUI:
                 # Set flag to prevent save dialog during initial model creation
                 self.model_changing = True
                 self.model_manager.create_model(name, description, author, version)
+                self._refresh_dropdown_values()
                 self.load_model(name)
-                self.update_model_dropdown()
                 self.model_changing = False
                 messagebox.showinfo("Success", f"Model '{name}' created successfully!")
             except Exception as e:
@@ -1793,7 +1908,7 @@ class TrainingGUI:
                     updated_model = self.model_manager.update_model_info(
                         self.current_model, description, author, version
                     )
-                    self.update_model_dropdown()
+                    self._sync_dropdown_selection()
                     messagebox.showinfo("Success", "Model information updated successfully!")
                 except Exception as e:
                     messagebox.showerror("Error", f"Failed to update model: {str(e)}")
@@ -1806,11 +1921,12 @@ class TrainingGUI:
         """Load a model without triggering the save dialog"""
         try:
             model_data = self.model_manager.load_model(model_name)
-            self.qa_groups = model_data.get('qa_groups', [])
+            self._set_groups(model_data.get('qa_groups', []))
             self.current_model = model_name
-            if hasattr(self, 'scroll_frame'):
-                self.refresh_groups()
-            self.update_model_dropdown()
+            self._dirty = False
+            if self.canvas is not None:
+                self.request_refresh()
+            self._sync_dropdown_selection()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load model: {str(e)}")
     
@@ -1821,6 +1937,7 @@ class TrainingGUI:
         
         try:
             self.model_manager.save_model(self.current_model, self.qa_groups)
+            self._dirty = False
             return True
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save model: {str(e)}")
@@ -1832,10 +1949,8 @@ class TrainingGUI:
             return
             
         if model_name and model_name != self.current_model:
-            # Check if we have unsaved changes
-            has_unsaved_changes = bool(self.current_model and self.qa_groups)
-            
-            if has_unsaved_changes:
+            # Groups are saved as they change, so this only prompts after a failed save
+            if self.current_model and self._dirty:
                 response = messagebox.askyesnocancel(
                     "Save Changes", 
                     f"Save changes to current model '{self.current_model}' before switching?"
@@ -1856,10 +1971,13 @@ class TrainingGUI:
             self.load_model(model_name)
             self.model_changing = False
     
-    def update_model_dropdown(self):
+    def _refresh_dropdown_values(self):
+        """Reload the combobox list; only needed when models are added or removed"""
         if hasattr(self, 'model_combobox'):
-            current_selection = self.model_combobox.get()
             self.model_combobox['values'] = self.model_manager.available_models
+    
+    def _sync_dropdown_selection(self):
+        if hasattr(self, 'model_combobox'):
             if self.current_model:
                 self.model_combobox.set(self.current_model)
             elif self.model_manager.available_models:
@@ -1996,7 +2114,7 @@ class TrainingGUI:
             font=('Arial', 9)
         )
         search_entry.pack(side=tk.LEFT, padx=(5, 15))
-        self.search_var.trace('w', self.on_search)
+        self.search_var.trace('w', self._schedule_search)
         
         self.search_mode = tk.StringVar(value="both")
         mode_frame = tk.Frame(search_line, bg='#1a1a2e')
@@ -2012,7 +2130,7 @@ class TrainingGUI:
                 fg='white',
                 selectcolor='#6c63ff',
                 font=('Arial', 9),
-                command=self.on_search
+                command=self._schedule_search
             )
             rb.pack(side=tk.LEFT, padx=(0, 8))
         
@@ -2037,6 +2155,18 @@ class TrainingGUI:
             fg='black',
             font=('Arial', 9),
             padx=12
+        ).pack(side=tk.LEFT, padx=(0, 4))
+        
+        # Compact exports skip indentation; meant for files read by tools
+        self.pretty_export = tk.BooleanVar(value=True)
+        tk.Checkbutton(
+            actions,
+            text="Pretty-print",
+            variable=self.pretty_export,
+            bg='#1a1a2e',
+            fg='white',
+            selectcolor='#6c63ff',
+            font=('Arial', 9)
         ).pack(side=tk.LEFT, padx=(0, 8))
         
         tk.Button(
@@ -2058,72 +2188,155 @@ class TrainingGUI:
         scrollbar = ttk.Scrollbar(
             container, 
             orient=tk.VERTICAL, 
-            command=self.canvas.yview,
+            command=self.on_scrollbar,
             style='Dark.Vertical.TScrollbar'
         )
         
-        self.scroll_frame = tk.Frame(self.canvas, bg='#1a1a2e')
-        self.scroll_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-        
-        self.canvas.create_window((0, 0), window=self.scroll_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=scrollbar.set)
         
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        self.canvas.bind("<MouseWheel>", self.on_mousewheel)
-        self.scroll_frame.bind("<MouseWheel>", self.on_mousewheel)
+        self.canvas.bind("<Configure>", self.on_canvas_configure)
+        self.canvas.bind("<Map>", self.on_canvas_map)
+        # Bound app-wide only while the pointer is over the list, so the wheel
+        # also works over cards and each tick is handled exactly once
+        self.canvas.bind("<Enter>", self._bind_mousewheel)
+        self.canvas.bind("<Leave>", self._unbind_mousewheel)
+    
+    def request_refresh(self):
+        """Refresh now if the list is on screen, otherwise once it is mapped"""
+        if self.canvas.winfo_viewable():
+            self.refresh_groups()
+        else:
+            self._needs_refresh = True
+    
+    def on_canvas_map(self, event):
+        if self._needs_refresh:
+            self._needs_refresh = False
+            self.refresh_groups()
+    
+    def on_scrollbar(self, *args):
+        self.canvas.yview(*args)
+        self.render_visible_cards()
+    
+    def _bind_mousewheel(self, event):
+        self.canvas.bind_all("<MouseWheel>", self.on_mousewheel)
+    
+    def _unbind_mousewheel(self, event):
+        # Moving onto a card also leaves the canvas; keep the binding until
+        # the pointer is outside the list altogether
+        try:
+            widget = self.canvas.winfo_containing(event.x_root, event.y_root)
+        except KeyError:
+            widget = None
+        path = str(self.canvas)
+        if widget is None or not (str(widget) == path or str(widget).startswith(path + '.')):
+            self.canvas.unbind_all("<MouseWheel>")
     
     def on_mousewheel(self, event):
-        self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        # Wheel ticks arriving within one frame are applied as a single scroll
+        self._pending_scroll += int(-1 * (event.delta / 120))
+        if self._scroll_after_id is None:
+            self._scroll_after_id = self.root.after(16, self._flush_scroll)
+    
+    def _flush_scroll(self):
+        self._scroll_after_id = None
+        if self._pending_scroll:
+            self.canvas.yview_scroll(self._pending_scroll, "units")
+            self._pending_scroll = 0
+            self.render_visible_cards()
+    
+    def on_canvas_configure(self, event):
+        self.canvas.configure(scrollregion=(0, 0, event.width, len(self.filtered_groups) * self.ROW_PITCH))
+        for card in self.visible_cards.values():
+            self.canvas.itemconfigure(card['item'], width=event.width - 4)
+        self.render_visible_cards()
+    
+    def hide_card(self, card):
+        self.canvas.itemconfigure(card['item'], state='hidden')
+        self.card_pool.append(card)
+    
+    def render_visible_cards(self, refill=False):
+        """Show cards for the rows in view, recycling the ones scrolled out of it.
+        With refill, cards already in view are refilled in place for new data."""
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first = max(0, int(top // self.ROW_PITCH))
+        last = min(len(self.filtered_groups), int(bottom // self.ROW_PITCH) + 1)
+        
+        for row in [row for row in self.visible_cards if not first <= row < last]:
+            self.hide_card(self.visible_cards.pop(row))
+        
+        width = self.canvas.winfo_width() - 4
+        for row in range(first, last):
+            card = self.visible_cards.get(row)
+            if card is not None and not refill:
+                continue
+            index = self.filtered_groups[row]
+            if card is None:
+                card = self.card_pool.pop() if self.card_pool else self.create_group_card()
+                self.fill_group_card(card, self.qa_groups[index], index)
+                self.canvas.coords(card['item'], 2, row * self.ROW_PITCH + 4)
+                self.canvas.itemconfigure(card['item'], state='normal', width=width)
+                self.visible_cards[row] = card
+            else:
+                self.fill_group_card(card, self.qa_groups[index], index)
     
     def on_search(self, *args):
+        self._search_after_id = None
         self.refresh_groups()
     
+    def _schedule_search(self, *args):
+        """Rebuild the list once typing pauses instead of on every keystroke"""
+        if self._search_after_id:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(200, self.on_search)
+    
     def refresh_groups(self):
-        for widget in self.scroll_frame.winfo_children():
-            widget.destroy()
-        
         search_term = self.search_var.get().lower()
         search_mode = self.search_mode.get()
         
-        filtered_groups = []
-        for group in self.qa_groups:
-            if not search_term:
-                filtered_groups.append(group)
-                continue
-            
+        if not search_term:
+            filtered_groups = list(range(len(self.search_index)))
+        else:
             if search_mode == "both":
-                match = (search_term in group['group_name'].lower() or 
-                        search_term in group.get('group_description', '').lower())
+                fields = (0, 1)
             elif search_mode == "name":
-                match = search_term in group['group_name'].lower()
+                fields = (0,)
             else:
-                match = search_term in group.get('group_description', '').lower()
+                fields = (1,)
             
-            if match:
-                filtered_groups.append(group)
-        
-        for i, group in enumerate(filtered_groups):
-            self.create_group_card(group, i)
+            # Terms of three or more characters only check groups sharing all
+            # their trigrams; shorter ones still scan every group
+            if len(search_term) >= 3:
+                candidates = sorted(self._trigram_candidates(search_term, fields))
+            else:
+                candidates = range(len(self.search_index))
+            
+            filtered_groups = [
+                index for index in candidates
+                if any(search_term in self.search_index[index][field] for field in fields)
+            ]
         
-        total_questions = sum(len(g['questions']) for g in self.qa_groups)
-        total_answers = sum(len(g['answers']) for g in self.qa_groups)
+        self.filtered_groups = filtered_groups
+        # One scrollregion update per refresh; cards still in view keep their
+        # place and are only refilled, surplus ones are hidden
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), len(filtered_groups) * self.ROW_PITCH))
+        self.render_visible_cards(refill=True)
         
         self.stats_vars["Groups"].set(str(len(self.qa_groups)))
-        self.stats_vars["Questions"].set(str(total_questions))
-        self.stats_vars["Answers"].set(str(total_answers))
-        
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.stats_vars["Questions"].set(str(self.totals['questions']))
+        self.stats_vars["Answers"].set(str(self.totals['answers']))
     
-    def create_group_card(self, group, index):
-        card = tk.Frame(self.scroll_frame, bg='#252547', relief='raised', bd=1)
-        card.pack(fill=tk.X, pady=4, padx=2)
+    def create_group_card(self):
+        """Build an empty, hidden card; fill_group_card gives it a group to show"""
+        frame = tk.Frame(self.canvas, bg='#252547', relief='raised', bd=1)
+        # Buttons read the group index off the card, so refilling a card
+        # never needs new callbacks
+        card = {'frame': frame, 'index': None}
         
-        content = tk.Frame(card, bg='#252547')
+        content = tk.Frame(frame, bg='#252547')
         content.pack(fill=tk.X, padx=12, pady=10)
         
         header = tk.Frame(content, bg='#252547')
@@ -2132,73 +2345,161 @@ class TrainingGUI:
         text_frame = tk.Frame(header, bg='#252547')
         text_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
-        tk.Label(
+        card['name_label'] = tk.Label(
             text_frame,
-            text=group['group_name'],
             font=('Arial', 12, 'bold'),
             bg='#252547',
             fg='white'
-        ).pack(anchor='w')
+        )
+        card['name_label'].pack(anchor='w')
         
-        if group.get('group_description'):
-            tk.Label(
-                text_frame,
-                text=group['group_description'],
-                font=('Arial', 9),
-                bg='#252547',
-                fg='#b0b0d0'
-            ).pack(anchor='w', pady=(1, 0))
+        card['desc_label'] = tk.Label(
+            text_frame,
+            font=('Arial', 9),
+            bg='#252547',
+            fg='#b0b0d0'
+        )
         
         actions = tk.Frame(header, bg='#252547')
         actions.pack(side=tk.RIGHT)
         
-        tk.Button(
+        card['edit_btn'] = tk.Button(
             actions,
             text="Edit",
-            command=lambda i=index: self.edit_group(i),
+            command=lambda: self.edit_group(card['index']),
             bg='#6c63ff',
             fg='white',
             font=('Arial', 8),
             padx=8
-        ).pack(side=tk.LEFT, padx=(0, 5))
+        )
+        card['edit_btn'].pack(side=tk.LEFT, padx=(0, 5))
         
-        tk.Button(
+        card['delete_btn'] = tk.Button(
             actions,
             text="Delete",
-            command=lambda i=index: self.delete_group(i),
+            command=lambda: self.delete_group(card['index']),
             bg='#ff4d7d',
             fg='white',
             font=('Arial', 8),
             padx=8
-        ).pack(side=tk.LEFT)
+        )
+        card['delete_btn'].pack(side=tk.LEFT)
         
         stats = tk.Frame(content, bg='#252547')
         stats.pack(fill=tk.X)
         
-        followup_count = self.count_followup_nodes(group.get('follow_ups', []))
-        stats_text = f"Questions: {len(group['questions'])} | Answers: {len(group['answers'])} | Topic: {group['topic']} | Follow-ups: {followup_count}"
-        tk.Label(
+        card['stats_label'] = tk.Label(
             stats,
-            text=stats_text,
             font=('Arial', 8),
             bg='#252547',
             fg='#b0b0d0'
-        ).pack(anchor='w')
+        )
+        card['stats_label'].pack(anchor='w')
+        
+        card['item'] = self.canvas.create_window(
+            2, 0,
+            window=frame,
+            anchor='nw',
+            height=self.CARD_HEIGHT,
+            state='hidden'
+        )
+        return card
+    
+    def fill_group_card(self, card, group, index):
+        card['name_label'].configure(text=group['group_name'])
+        
+        description = group.get('group_description')
+        card['desc_label'].configure(text=description or '')
+        if description:
+            card['desc_label'].pack(anchor='w', pady=(1, 0))
+        else:
+            card['desc_label'].pack_forget()
+        
+        card['index'] = index
+        
+        followup_count = self.followup_counts[index]
+        stats_text = f"Questions: {len(group['questions'])} | Answers: {len(group['answers'])} | Topic: {group['topic']} | Follow-ups: {followup_count}"
+        card['stats_label'].configure(text=stats_text)
     
     def count_followup_nodes(self, data):
         count = 0
-        for item in data:
-            count += 1
-            count += self.count_followup_nodes(item.get('children', []))
+        stack = [data]
+        while stack:
+            items = stack.pop()
+            count += len(items)
+            stack.extend(item.get('children', []) for item in items)
         return count
     
+    # qa_groups is only changed through these so the search index, totals
+    # and follow-up counts stay in step
+    def _search_key(self, group):
+        return group['group_name'].lower(), group.get('group_description', '').lower()
+    
+    def _count(self, group, sign=1):
+        self.totals['questions'] += sign * len(group['questions'])
+        self.totals['answers'] += sign * len(group['answers'])
+    
+    def _index_trigrams(self, index):
+        for field, text in enumerate(self.search_index[index]):
+            table = self.trigram_index[field]
+            for gram in _trigrams(text):
+                table.setdefault(gram, set()).add(index)
+    
+    def _trigram_candidates(self, term, fields):
+        if self.trigram_index is None:
+            self.trigram_index = ({}, {})
+            for index in range(len(self.search_index)):
+                self._index_trigrams(index)
+        
+        candidates = set()
+        grams = _trigrams(term)
+        for field in fields:
+            sets = [self.trigram_index[field].get(gram) for gram in grams]
+            if all(sets):
+                candidates |= set.intersection(*sets)
+        return candidates
+    
+    def _set_groups(self, groups):
+        self.qa_groups = groups
+        self.search_index = [self._search_key(group) for group in groups]
+        self.trigram_index = None
+        self.followup_counts = [self.count_followup_nodes(group.get('follow_ups', [])) for group in groups]
+        self.totals = {'questions': 0, 'answers': 0}
+        for group in groups:
+            self._count(group)
+    
+    def _add_group(self, group):
+        self.qa_groups.append(group)
+        self.search_index.append(self._search_key(group))
+        if self.trigram_index is not None:
+            self._index_trigrams(len(self.search_index) - 1)
+        self.followup_counts.append(self.count_followup_nodes(group.get('follow_ups', [])))
+        self._count(group)
+        self._dirty = True
+    
+    def _replace_group(self, index, group):
+        self._count(self.qa_groups[index], -1)
+        self.qa_groups[index] = group
+        self.search_index[index] = self._search_key(group)
+        self.trigram_index = None
+        self.followup_counts[index] = self.count_followup_nodes(group.get('follow_ups', []))
+        self._count(group)
+        self._dirty = True
+    
+    def _remove_group(self, index):
+        self._count(self.qa_groups.pop(index), -1)
+        self.search_index.pop(index)
+        self.trigram_index = None  # every later index shifts down
+        self.followup_counts.pop(index)
+        self._dirty = True
+    
     def new_group(self):
         if not self.current_model:
             messagebox.showwarning("Warning", "Please create or select a model first.")
             return
             
         def on_save(group_data):
-            self.qa_groups.append(group_data)
+            self._add_group(group_data)
             if self.save_current_model():
                 self.refresh_groups()
         
@@ -2210,7 +2511,7 @@ class TrainingGUI:
             return
             
         def on_save(group_data):
-            self.qa_groups[index] = group_data
+            self._replace_group(index, group_data)
             if self.save_current_model():
                 self.refresh_groups()
         
@@ -2222,7 +2523,7 @@ class TrainingGUI:
             return
             
         if messagebox.askyesno("Confirm", "Delete this group?"):
-            self.qa_groups.pop(index)
+            self._remove_group(index)
             if self.save_current_model():
                 self.refresh_groups()
     
@@ -2233,33 +2534,25 @@ class TrainingGUI:
             
         filename = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
         if filename:
-            try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                # Handle both array format and object format
-                if isinstance(data, list):
-                    imported_groups = data
-                else:
-                    imported_groups = [data]
+            model_name = self.current_model
+            
+            # Parse on the I/O thread; groups are only added back on the Tk thread
+            def finish(imported_groups, error):
+                if error is not None:
+                    messagebox.showerror("Error", f"Import failed: {str(error)}")
+                    return
+                if self.current_model != model_name:
+                    messagebox.showwarning("Warning", "The model changed while importing; nothing was imported.")
+                    return
                 
-                for i, qa in enumerate(imported_groups):
-                    self.qa_groups.append({
-                        'group_name': qa.get('group_name', f"Imported {i+1}"),
-                        'group_description': qa.get('group_description', "Imported from JSON"),
-                        'questions': qa.get('questions', []),
-                        'answers': qa.get('answers', []),
-                        'topic': qa.get('topic', 'general'),
-                        'priority': qa.get('priority', 'medium'),
-                        'follow_ups': qa.get('follow_ups', [])
-                    })
+                for group in imported_groups:
+                    self._add_group(group)
                 
                 if self.save_current_model():
                     self.refresh_groups()
                     messagebox.showinfo("Success", f"Imported {len(imported_groups)} groups")
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Import failed: {str(e)}")
+            
+            run_in_background(self.root, lambda: _read_import_file(filename), finish)
     
     def export_json(self):
         if not self.qa_groups:
@@ -2272,25 +2565,25 @@ class TrainingGUI:
         )
         if filename:
             try:
-                export_data = []
-                for group in self.qa_groups:
-                    export_data.append({
-                        'group_name': group['group_name'],
-                        'group_description': group.get('group_description', ''),
-                        'questions': group['questions'],
-                        'answers': group['answers'],
-                        'topic': group['topic'],
-                        'priority': group['priority'],
-                        'follow_ups': group.get('follow_ups', [])
-                    })
-                
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
-                
-                messagebox.showinfo("Success", "Data exported successfully")
-                
+                export_data = [
+                    {key: group[key] if key in group else EXPORT_DEFAULTS[key] for key in EXPORT_KEYS}
+                    for group in self.qa_groups
+                ]
+                # The rows share their lists with self.qa_groups, so serialize here
+                # while nothing else can edit them; only the bytes go to the I/O thread
+                payload = _dumps(export_data, self.pretty_export.get())
             except Exception as e:
                 messagebox.showerror("Error", f"Export failed: {str(e)}")
+                return
+            
+            # Write on the I/O thread
+            def finish(result, error):
+                if error is not None:
+                    messagebox.showerror("Error", f"Export failed: {str(error)}")
+                    return
+                messagebox.showinfo("Success", "Data exported successfully")
+            
+            run_in_background(self.root, lambda: _write_export_file(filename, payload), finish)
 
 def main():
     root = tk.Tk()
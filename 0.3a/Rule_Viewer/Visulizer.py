@@ -11,11 +11,36 @@ Neural-network-style layered layout:
 """
 
 import json
+from itertools import product
 import tkinter as tk
 from tkinter import filedialog, messagebox
-import networkx as nx
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# networkx / numpy / matplotlib are imported on the first load so the
+# window can open before the plotting stack has loaded.
+nx = None
+np = None
+plt = None
+mcolors = None
+LineCollection = None
+FigureCanvasTkAgg = None
+
+def _import_plot_libs():
+    global nx, np, plt, mcolors, LineCollection, FigureCanvasTkAgg
+    if plt is None:
+        import networkx
+        import numpy
+        import matplotlib.pyplot as pyplot
+        import matplotlib.colors as colors
+        from matplotlib.collections import LineCollection as line_cls
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg as canvas_cls
+        nx, np, plt, mcolors, LineCollection, FigureCanvasTkAgg = (
+            networkx, numpy, pyplot, colors, line_cls, canvas_cls)
 
 # ------------------- Config -------------------
 MAX_WORDS_PER_LINE = 4
@@ -36,6 +61,15 @@ VERTICAL_MARGIN = 0.05
 MIN_SCALE = 0.1
 MAX_SCALE = 50.0
 
+NODE_COLORS = {
+    'ai_root':"#FFAA00",
+    'group':"#1f77b4",
+    'root_question':"#2ca02c",
+    'root_answer':"#d62728",
+    'follow_up_question':"#17becf",
+    'follow_up_answer':"#ff7f0e"
+}
+
 # ------------------- UI -------------------
 root = tk.Tk()
 root.title("QA Neural Network Visualizer")
@@ -49,13 +83,19 @@ load_btn = tk.Button(toolbar, text="Load JSON File", bg="#444444", fg="white",
 load_btn.pack(side=tk.LEFT, padx=8, pady=6)
 
 # ------------------- Graph / state -------------------
-G = nx.DiGraph()
-base_pos = {}
+G = None  # nx.DiGraph, created on the first load
+pos_x = None  # base positions as arrays, in G.nodes() order
+pos_y = None
 base_node_sizes = []
+base_node_colors = None  # RGBA rows in node_list order
+label_texts = []  # formatted label per node, in node_list order
 node_list = []
 label_artists = {}
 node_collection = None
 edge_collection = None
+edge_segments = None  # (E, 2, 2) edge endpoints, in G.edges() order
+label_extent_em = 0.0  # largest label half-extent, in multiples of the font size
+background = None  # figure pixels without the graph, captured on every full draw
 
 scale = INITIAL_SCALE
 view_center = (0.0, 0.0)
@@ -64,6 +104,7 @@ base_span_y = 1.0
 
 is_dragging = False
 last_mouse = None
+redraw_pending = False
 
 fig = None
 ax = None
@@ -78,101 +119,108 @@ def format_label(raw: str) -> str:
     lines = [" ".join(words[i:i+MAX_WORDS_PER_LINE]) for i in range(0, len(words), MAX_WORDS_PER_LINE)]
     return "\n".join(lines)
 
-def safe_text_from_node_id(node_id: str) -> str:
-    for p in ("Q: ", "A: ", "Group: ", "AI: "):
-        if node_id.startswith(p):
-            return node_id[len(p):]
-    return node_id
-
 # ------------------- Graph building -------------------
 def add_followup_nodes(fu_node, parent_answers, level):
-    q_text = fu_node.get("question", "").strip()
-    a_text = fu_node.get("answer", "").strip()
-    current_q_nodes = []
-    current_a_nodes = []
-
-    if q_text:
-        q_id = f"Q: {q_text}"
-        G.add_node(q_id, type="follow_up_question", level=level)
-        for pa in parent_answers:
-            G.add_edge(pa, q_id)
-        current_q_nodes.append(q_id)
-
-    if a_text:
-        a_id = f"A: {a_text}"
-        G.add_node(a_id, type="follow_up_answer", level=level+1)
-        for qn in current_q_nodes or parent_answers:
-            G.add_edge(qn, a_id)
-        current_a_nodes.append(a_id)
-
-    # Fully connect questions ↔ answers
-    for qn in current_q_nodes:
-        for an in current_a_nodes:
-            G.add_edge(qn, an)
-    for an in current_a_nodes:
-        for qn in current_q_nodes:
-            G.add_edge(an, qn)
-
-    next_parents = current_a_nodes or current_q_nodes or parent_answers
-    for child in fu_node.get("children", []):
-        add_followup_nodes(child, next_parents, level+2)
+    # Explicit stack instead of recursion so deep follow-up trees can't hit
+    # the recursion limit; children are pushed reversed to keep the order
+    stack = [(fu_node, parent_answers, level)]
+    while stack:
+        fu_node, parent_answers, level = stack.pop()
+        q_text = fu_node.get("question", "").strip()
+        a_text = fu_node.get("answer", "").strip()
+        current_q_nodes = []
+        current_a_nodes = []
+
+        if q_text:
+            q_id = f"Q: {q_text}"
+            G.add_node(q_id, type="follow_up_question", level=level, text=q_text)
+            G.add_edges_from((pa, q_id) for pa in parent_answers)
+            current_q_nodes.append(q_id)
+
+        if a_text:
+            a_id = f"A: {a_text}"
+            G.add_node(a_id, type="follow_up_answer", level=level+1, text=a_text)
+            G.add_edges_from((qn, a_id) for qn in current_q_nodes or parent_answers)
+            current_a_nodes.append(a_id)
+
+        # Fully connect questions ↔ answers; one edge per pair is enough
+        # since edges are drawn without arrows
+        G.add_edges_from(product(current_q_nodes, current_a_nodes))
+
+        next_parents = current_a_nodes or current_q_nodes or parent_answers
+        for child in reversed(fu_node.get("children", [])):
+            stack.append((child, next_parents, level+2))
 
 def add_group_nodes(group, parent=None, level=0):
-    group_id = f"Group: {group.get('group_name','')}"
-    G.add_node(group_id, type="group", level=level)
+    group_name = group.get('group_name','')
+    group_id = f"Group: {group_name}"
+    G.add_node(group_id, type="group", level=level, text=group_name)
     if parent:
         G.add_edge(parent, group_id)
 
+    # Each node keeps its raw text so labels don't have to strip the id prefix
     questions = group.get("questions", [])
     answers = group.get("answers", [])
-    q_nodes = []
-    a_nodes = []
-
-    for q in questions:
-        q_id = f"Q: {q}"
-        G.add_node(q_id, type="root_question", level=level+1)
-        G.add_edge(group_id, q_id)
-        q_nodes.append(q_id)
-
-    for a in answers:
-        a_id = f"A: {a}"
-        G.add_node(a_id, type="root_answer", level=level+2)
-        a_nodes.append(a_id)
-
-    for q in q_nodes:
-        for a in a_nodes:
-            G.add_edge(q, a)
-    for a in a_nodes:
-        for q in q_nodes:
-            G.add_edge(a, q)
+    q_nodes = [f"Q: {q}" for q in questions]
+    a_nodes = [f"A: {a}" for a in answers]
+
+    G.add_nodes_from(((q_id, {'type': "root_question", 'level': level+1, 'text': q})
+                      for q_id, q in zip(q_nodes, questions)))
+    G.add_edges_from((group_id, q_id) for q_id in q_nodes)
+    G.add_nodes_from(((a_id, {'type': "root_answer", 'level': level+2, 'text': a})
+                      for a_id, a in zip(a_nodes, answers)))
+
+    # Fully connect questions ↔ answers; one edge per pair is enough
+    # since edges are drawn without arrows
+    G.add_edges_from(product(q_nodes, a_nodes))
 
     for fu in group.get("follow_ups", []):
         add_followup_nodes(fu, a_nodes, level+3)
 
+def load_graph(path):
+    """Rebuild G from a model file; with ijson the groups are streamed one at a time"""
+    G.clear()
+    with open(path, "rb") as fh:
+        if IJSON_AVAILABLE:
+            # Short pass for the name, which may sit after qa_groups, then
+            # a second pass that hands over one group at a time
+            name = next((value for prefix, event, value in ijson.parse(fh)
+                         if prefix == 'name' and event in ('string', 'number', 'boolean', 'null')), 'Unknown')
+            fh.seek(0)
+            groups = ijson.items(fh, 'qa_groups.item')
+        else:
+            data = json.load(fh)
+            name = data.get('name', 'Unknown')
+            groups = data.get("qa_groups", [])
+
+        ai_name = f"AI: {name}"
+        G.add_node(ai_name, type='ai_root', level=0, text=name)
+        for group in groups:
+            add_group_nodes(group, parent=ai_name, level=1)
+
 # ------------------- Layout -------------------
 def compute_base_layout():
     _compute_layered_layout()
 
 def _compute_layered_layout():
-    global base_pos
-    base_pos.clear()
+    global pos_x, pos_y
+    nodes = list(G.nodes())
     layers = {}
-    for n, attr in G.nodes(data=True):
+    for i, (n, attr) in enumerate(G.nodes(data=True)):
         lvl = attr.get('level', 0)
-        layers.setdefault(lvl, []).append(n)
+        layers.setdefault(lvl, []).append(i)
 
-    for lvl in sorted(layers.keys()):
-        nodes = layers[lvl]
-        count = len(nodes)
-        y_step = 1.0 / (count + 1)
-        for i, n in enumerate(nodes):
-            y = 0.5 - (i+1)*y_step
-            x = AI_LEFT_OFFSET + lvl * LAYER_X_SPACING
-            base_pos[n] = (x, y)
+    pos_x = np.empty(len(nodes))
+    pos_y = np.empty(len(nodes))
+    for lvl, members in layers.items():
+        count = len(members)
+        pos_x[members] = AI_LEFT_OFFSET + lvl * LAYER_X_SPACING
+        pos_y[members] = 0.5 - np.arange(1, count+1) * (1.0 / (count + 1))
 
 # ------------------- Prepare drawing -------------------
 def prepare_drawing_state():
-    global node_list, base_node_sizes, label_artists, base_span_x, base_span_y, view_center
+    global node_list, base_node_sizes, base_node_colors, edge_segments, label_texts, label_extent_em
+    global label_artists, base_span_x, base_span_y, view_center
     node_list = list(G.nodes())
     base_node_sizes = []
     sizes_map = {
@@ -183,11 +231,29 @@ def prepare_drawing_state():
     for n in node_list:
         t = G.nodes[n].get('type')
         base_node_sizes.append(sizes_map.get(t,2000))
-
-    xs = [p[0] for p in base_pos.values()] if base_pos else [0]
-    ys = [p[1] for p in base_pos.values()] if base_pos else [0]
-    minx, maxx = min(xs), max(xs)
-    miny, maxy = min(ys), max(ys)
+    base_node_sizes = np.asarray(base_node_sizes, dtype=float)
+    # Node types never change after a load, so colors are converted once
+    base_node_colors = mcolors.to_rgba_array([get_node_color(n) for n in node_list])
+
+    # Label text only depends on the node id, so it is formatted once per load
+    label_texts = [format_label(G.nodes[n]['text']) for n in node_list]
+    label_extent_em = 0.0
+    for txt in label_texts:
+        # Rough bold glyph width 0.7em, line height 1.2em
+        lines = txt.split("\n")
+        label_extent_em = max(label_extent_em, 0.35*max(len(line) for line in lines), 0.6*len(lines))
+
+    # Edge endpoints by node index, gathered from the position arrays once
+    index = {n: i for i, n in enumerate(node_list)}
+    ends = np.fromiter((index[n] for e in G.edges() for n in e), dtype=np.int32).reshape(-1, 2)
+    edge_segments = np.stack([np.column_stack([pos_x[ends[:, 0]], pos_y[ends[:, 0]]]),
+                              np.column_stack([pos_x[ends[:, 1]], pos_y[ends[:, 1]]])], axis=1)
+
+    if len(node_list):
+        minx, maxx = float(pos_x.min()), float(pos_x.max())
+        miny, maxy = float(pos_y.min()), float(pos_y.max())
+    else:
+        minx = maxx = miny = maxy = 0.0
 
     # Exact fit, no padding
     base_span_x = max(1.0e-3, (maxx - minx))
@@ -198,48 +264,121 @@ def prepare_drawing_state():
 # ------------------- Draw -------------------
 def get_node_color(n):
     t = G.nodes[n].get('type')
-    colors = {
-        'ai_root':"#FFAA00",
-        'group':"#1f77b4",
-        'root_question':"#2ca02c",
-        'root_answer':"#d62728",
-        'follow_up_question':"#17becf",
-        'follow_up_answer':"#ff7f0e"
-    }
-    return colors.get(t,"#888888")
+    return NODE_COLORS.get(t,"#888888")
 
-def draw_graph():
+def build_artists():
+    """Create the node, edge and label artists once per load; see apply_scale for zoom"""
     global node_collection, edge_collection, label_artists, fig, ax, canvas
     ax.clear()
     fig.patch.set_facecolor("#222222")
     ax.set_facecolor("#222222")
     ax.set_axis_off()
 
+    node_sizes_now = base_node_sizes*(scale**2)
+
+    node_collection = ax.scatter(pos_x, pos_y, s=node_sizes_now, c=base_node_colors, marker='o',
+                                 edgecolors='black', linewidths=BASE_NODE_EDGEWIDTH*scale, zorder=2)
+    edge_collection = LineCollection(edge_segments, colors='white', linewidths=BASE_LINEWIDTH*scale,
+                                     antialiaseds=(1,), zorder=1)
+    ax.add_collection(edge_collection, autolim=False)
+    label_artists.clear()
+    fontsize_now = max(1.0, BASE_LABEL_SIZE*scale)
+    for n, txt, x, y in zip(node_list, label_texts, pos_x.tolist(), pos_y.tolist()):
+        ta = ax.text(x, y, txt, ha='center', va='center', fontsize=fontsize_now, color='white', fontweight='bold')
+        label_artists[n] = ta
+
+    # Animated artists are left out of full draws and blitted over the background
+    for artist in graph_artists():
+        artist.set_animated(True)
+
+def apply_scale():
+    """Resize the existing artists for the current zoom instead of rebuilding them"""
+    # Node sizes are set per view in cull_to_view
+    node_collection.set_linewidth(BASE_NODE_EDGEWIDTH*scale)
+    edge_collection.set_linewidth(BASE_LINEWIDTH*scale)
+    fontsize_now = max(1.0, BASE_LABEL_SIZE*scale)
+    for ta in label_artists.values():
+        ta.set_fontsize(fontsize_now)
+
+def graph_artists():
+    artists = [a for a in (edge_collection, node_collection) if a]
+    artists.extend(label_artists.values())
+    return artists
+
+def draw_graph_artists():
+    for artist in graph_artists():
+        ax.draw_artist(artist)
+
+def refresh_view():
+    """Move the camera and repaint the graph over the cached background"""
     half_x = (base_span_x / 2.0) / scale
     half_y = (base_span_y / 2.0) / scale
     cx, cy = view_center
     ax.set_xlim(cx-half_x, cx+half_x)
     ax.set_ylim(cy-half_y, cy+half_y)
+    cull_to_view()
 
-    pos = base_pos.copy()
-    node_sizes_now = [s*(scale**2) for s in base_node_sizes]
-
-    node_collection = nx.draw_networkx_nodes(G, pos=pos, nodelist=node_list,
-                                             node_color=[get_node_color(n) for n in node_list],
-                                             node_size=node_sizes_now,
-                                             edgecolors='black',
-                                             linewidths=BASE_NODE_EDGEWIDTH*scale,
-                                             ax=ax)
-    edge_collection = nx.draw_networkx_edges(G, pos=pos, ax=ax,
-                                             edge_color='white', width=BASE_LINEWIDTH*scale, arrows=False)
-    label_artists.clear()
+    if background is None:
+        canvas.draw_idle()
+        return
+    canvas.restore_region(background)
+    draw_graph_artists()
+    canvas.blit(fig.bbox)
+
+def cull_to_view():
+    """Hand the artists only the nodes, edges and labels that can reach the view"""
+    xmin, xmax = ax.get_xlim()
+    ymin, ymax = ax.get_ylim()
+
+    # Markers and labels keep a constant size in data units while zooming;
+    # pad the view by the largest of them so nothing pops at the edges
     fontsize_now = max(1.0, BASE_LABEL_SIZE*scale)
-    for n in node_list:
-        x, y = pos[n]
-        txt = format_label(safe_text_from_node_id(n))
-        ta = ax.text(x, y, txt, ha='center', va='center', fontsize=fontsize_now, color='white', fontweight='bold')
-        label_artists[n] = ta
-    canvas.draw_idle()
+    node_radius = (np.sqrt(base_node_sizes.max())/2.0 + BASE_NODE_EDGEWIDTH)*scale
+    margin_px = max(node_radius, label_extent_em*fontsize_now) * fig.dpi / 72.0
+    pad_x = margin_px * (xmax - xmin) / max(1.0, ax.bbox.width)
+    pad_y = margin_px * (ymax - ymin) / max(1.0, ax.bbox.height)
+    xmin, xmax, ymin, ymax = xmin-pad_x, xmax+pad_x, ymin-pad_y, ymax+pad_y
+
+    visible = (pos_x >= xmin) & (pos_x <= xmax) & (pos_y >= ymin) & (pos_y <= ymax)
+
+    # Labels are not clipped to the axes and also show in the figure margin,
+    # so they are culled against the whole figure instead
+    (fx0, fy0), (fx1, fy1) = ax.transData.inverted().transform(
+        [(fig.bbox.x0, fig.bbox.y0), (fig.bbox.x1, fig.bbox.y1)])
+    labelled = ((pos_x >= fx0-pad_x) & (pos_x <= fx1+pad_x) &
+                (pos_y >= fy0-pad_y) & (pos_y <= fy1+pad_y))
+
+    node_collection.set_offsets(np.column_stack([pos_x[visible], pos_y[visible]]))
+    node_collection.set_sizes(base_node_sizes[visible]*(scale**2))
+    node_collection.set_facecolor(base_node_colors[visible])
+
+    # Keep an edge when its bounding box meets the view, so lines crossing
+    # it with both ends off screen still show
+    xs, ys = edge_segments[:, :, 0], edge_segments[:, :, 1]
+    keep = ((xs.min(axis=1) <= xmax) & (xs.max(axis=1) >= xmin) &
+            (ys.min(axis=1) <= ymax) & (ys.max(axis=1) >= ymin))
+    edge_collection.set_segments(edge_segments[keep])
+
+    for ta, shown in zip(label_artists.values(), labelled):
+        ta.set_visible(shown)
+
+def schedule_refresh():
+    """Coalesce pan/zoom events so at most one repaint runs per idle slice"""
+    global redraw_pending
+    if not redraw_pending:
+        redraw_pending = True
+        root.after_idle(_do_refresh)
+
+def _do_refresh():
+    global redraw_pending
+    redraw_pending = False
+    refresh_view()
+
+def on_draw(event):
+    # Full draws (first show, window resize) refresh the background
+    global background
+    background = canvas.copy_from_bbox(fig.bbox)
+    draw_graph_artists()
 
 # ------------------- Interaction -------------------
 def on_scroll(event):
@@ -253,7 +392,8 @@ def on_scroll(event):
     if old_scale != 0:
         view_center = (mx+(view_center[0]-mx)*(old_scale/scale),
                        my+(view_center[1]-my)*(old_scale/scale))
-    draw_graph()
+    apply_scale()
+    schedule_refresh()
 
 def on_press(event):
     global is_dragging,last_mouse
@@ -274,27 +414,23 @@ def on_motion(event):
     dx_data = dx*((base_span_x/scale)/w)
     dy_data = dy*((base_span_y/scale)/h)   # fixed: positive dy moves graph up
     view_center = (view_center[0]-dx_data, view_center[1]-dy_data)
-    draw_graph()
+    schedule_refresh()
 
 # ------------------- Load JSON -------------------
 def on_load_click():
-    global fig,ax,canvas,scale,view_center,base_pos
+    global G,fig,ax,canvas,scale,view_center,background
     path=filedialog.askopenfilename(title="Open QA JSON",filetypes=[("JSON files","*.json")])
     if not path: return
+
+    _import_plot_libs()
+    if G is None:
+        G = nx.DiGraph()
     try:
-        with open(path,"r",encoding="utf-8") as fh:
-            data=json.load(fh)
+        load_graph(path)
     except Exception as e:
         messagebox.showerror("Failed to open JSON",str(e))
         return
 
-    G.clear()
-    ai_name = f"AI: {data.get('name','Unknown')}"
-    G.add_node(ai_name, type='ai_root', level=0)
-
-    for group in data.get("qa_groups",[]):
-        add_group_nodes(group,parent=ai_name,level=1)
-
     compute_base_layout()
     prepare_drawing_state()
 
@@ -310,9 +446,12 @@ def on_load_click():
     canvas.mpl_connect("button_press_event",on_press)
     canvas.mpl_connect("button_release_event",on_release)
     canvas.mpl_connect("motion_notify_event",on_motion)
+    canvas.mpl_connect("draw_event",on_draw)
 
     scale=INITIAL_SCALE
-    draw_graph()
+    background=None
+    build_artists()
+    refresh_view()
 
 load_btn.config(command=on_load_click)
 root.mainloop()
@@ -9,11 +9,18 @@ from typing import List, Dict, Tuple, Optional, Callable
 from fuzzywuzzy import fuzz, process
 from collections import deque
 
+# Patterns applied to every incoming message, compiled once at import
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_JOINER_SPLIT_RE = re.compile(r'\s+and\s+|\s+then\s+|\s+also\s+', re.IGNORECASE)
+_WORD_RE = re.compile(r'\b\w+\b')
+
 class AdvancedChatbot:
     def __init__(self, model_name: str = None, config_file: str = "config.cfg", **kwargs):
         self.models_folder = "models"
         self.current_model = model_name
         self.config_file = config_file
+        # Sections already parsed from config_file by the caller, if any
+        self.preparsed_config = kwargs.get('preparsed_config', None)
         
         # Load configuration
         self.config = self.load_configuration()
@@ -126,7 +133,10 @@ class AdvancedChatbot:
             for key, value in options.items():
                 config.set(section, key, value)
         
-        if os.path.exists(self.config_file):
+        if self.preparsed_config is not None:
+            config.read_dict(self.preparsed_config)
+            print(f"✅ Loaded configuration from {self.config_file}")
+        elif os.path.exists(self.config_file):
             config.read(self.config_file)
             print(f"✅ Loaded configuration from {self.config_file}")
         else:
@@ -604,7 +614,7 @@ class AdvancedChatbot:
     
     def split_questions(self, text: str) -> List[str]:
         """Split multiple questions"""
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
         questions = []
         
         for sentence in sentences:
@@ -612,8 +622,9 @@ class AdvancedChatbot:
             if not sentence:
                 continue
             
-            if any(sep in sentence.lower() for sep in [' and ', ' then ', ' also ']):
-                parts = re.split(r'\s+and\s+|\s+then\s+|\s+also\s+', sentence, flags=re.IGNORECASE)
+            # One case-insensitive split both detects and applies the joiners
+            parts = _JOINER_SPLIT_RE.split(sentence)
+            if len(parts) > 1:
                 for part in parts:
                     part = part.strip()
                     if part and len(part) > 2:
@@ -674,7 +685,7 @@ class AdvancedChatbot:
     def extract_meaningful_entities(self, text: str) -> List[str]:
         """Extract meaningful entities"""
         entities = []
-        words = re.findall(r'\b\w+\b', text.lower())
+        words = _WORD_RE.findall(text.lower())
         
         for word in words:
             if (len(word) >= 4 and
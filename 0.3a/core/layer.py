@@ -21,6 +21,9 @@ try:
 except ImportError:
     from ai_engine import AdvancedChatbot
 
+# Splits streamed text into words, each keeping its trailing whitespace
+_TOKEN_RE = re.compile(r'\S+\s*')
+
 class StreamingLayer:
     """
     Handles streaming communication between GUI and AI engine.
@@ -29,6 +32,8 @@ class StreamingLayer:
     
     def __init__(self, config_file: str = "config.cfg", **kwargs):
         self.config_file = config_file
+        # Sections already parsed from config_file by the caller, if any
+        self.preparsed_config = kwargs.get('preparsed_config', None)
         
         # Load configuration
         self.config = self.load_configuration()
@@ -59,6 +64,7 @@ class StreamingLayer:
         # We'll handle all streaming in this layer
         self.ai_engine = AdvancedChatbot(
             config_file=config_file,
+            preparsed_config=self.preparsed_config,
             auto_start_chat=False,
             streaming_callback=None,  # We handle streaming in layer
             thinking_callback=None,   # We handle thinking in layer
@@ -97,7 +103,10 @@ class StreamingLayer:
             for key, value in options.items():
                 config.set(section, key, value)
         
-        if os.path.exists(self.config_file):
+        if self.preparsed_config is not None:
+            config.read_dict(self.preparsed_config)
+            print(f"✅ Loaded configuration from {self.config_file}")
+        elif os.path.exists(self.config_file):
             config.read(self.config_file)
             print(f"✅ Loaded configuration from {self.config_file}")
         else:
@@ -304,7 +313,7 @@ class StreamingLayer:
     def _stream_words(self, text: str, prefix: str, delay_per_word: float, callback: Callable) -> str:
         """Stream text word by word with preserved formatting"""
         # Use regex to split while preserving all whitespace
-        tokens = re.findall(r'\S+\s*', text)
+        tokens = _TOKEN_RE.findall(text)
         
         full_output = prefix
         callback(prefix)
@@ -721,6 +730,7 @@ def create_streaming_layer(config_file: str = "config.cfg", **kwargs) -> Streami
             - response_complete_callback: Callback for response completion
             - status_update_callback: Callback for status updates
             - error_callback: Callback for errors
+            - preparsed_config: {section: {key: value}} already read from config_file
     
     Returns:
         StreamingLayer instance
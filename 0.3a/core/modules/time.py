@@ -4,6 +4,7 @@ Handles time-related queries with summary responses.
 """
 
 import datetime
+from functools import lru_cache
 from typing import Optional
 try:
     from fuzzywuzzy import process as fuzzy_process, fuzz
@@ -12,6 +13,16 @@ except ImportError:
     FUZZY_AVAILABLE = False
     print("⚠️  fuzzywuzzy not installed. Install with: pip install fuzzywuzzy python-levenshtein")
 
+@lru_cache(maxsize=4)
+def _format_clock(wall_time: datetime.datetime) -> tuple:
+    """strftime fields for a naive wall-clock time; queries in the same second share them"""
+    return (
+        wall_time.strftime('%A'),
+        wall_time.strftime('%B'),
+        wall_time.strftime('%I:%M %p').lstrip('0'),  # Remove leading zero
+        wall_time.strftime('%H:%M'),
+    )
+
 class TimeModule:
     def __init__(self):
         self.name = "Time Module"
@@ -128,11 +139,15 @@ class TimeModule:
         Use fuzzy matching to find the best location match from user input.
         Returns (location_name, confidence_score, timezone_key) or None if no good match.
         """
+        return self._fuzzy_match_lowered(user_input.lower())
+
+    def _fuzzy_match_lowered(self, user_input: str) -> Optional[tuple]:
+        """fuzzy_match_location for input that is already lowercase"""
         if not FUZZY_AVAILABLE:
             return None
             
         # Extract potential location words (2-3 word phrases)
-        words = user_input.lower().split()
+        words = user_input.split()
         potential_queries = []
         
         # Create n-grams of 1, 2, and 3 words
@@ -179,18 +194,10 @@ class TimeModule:
         if is_general_query and not has_location_keyword:
             return "local", "your location", None
         
-        # First, try exact matching for common locations
-        for location, timezone_key in self.timezone_mapping.items():
-            if location in user_input:
-                print(f"📍 Time module exact match found: {location.title()}")
-                return "specified", location.title(), timezone_key
-        
-        # Try fuzzy matching if exact match fails
-        fuzzy_result = self.fuzzy_match_location(user_input)
-        if fuzzy_result:
-            location, confidence, timezone_key = fuzzy_result
-            print(f"📍 Time module fuzzy matched '{location}' with {confidence}% confidence")
-            return "specified", location.title(), timezone_key
+        # First, try exact then fuzzy matching on the whole query
+        result = self._match_location(user_input, "exact")
+        if result:
+            return result
         
         # Check for location patterns as fallback
         location_patterns = ["in ", "at ", "for "]
@@ -199,23 +206,29 @@ class TimeModule:
                 start_idx = user_input.find(pattern) + len(pattern)
                 remaining_text = user_input[start_idx:].strip()
                 
-                # Try exact match on remaining text
-                for location, timezone_key in self.timezone_mapping.items():
-                    if location in remaining_text:
-                        print(f"📍 Time module pattern match found: {location.title()}")
-                        return "specified", location.title(), timezone_key
-                
-                # Try fuzzy match on remaining text
-                fuzzy_result = self.fuzzy_match_location(remaining_text)
-                if fuzzy_result:
-                    location, confidence, timezone_key = fuzzy_result
-                    print(f"📍 Time module fuzzy matched '{location}' with {confidence}% confidence")
-                    return "specified", location.title(), timezone_key
+                result = self._match_location(remaining_text, "pattern")
+                if result:
+                    return result
         
         # No location specified - use local time with better messaging
         print("📍 No location specified, using local time")
         return "local", "your location", None
 
+    def _match_location(self, text: str, match_kind: str) -> Optional[tuple]:
+        """Exact match against the known locations, then fuzzy; text must be lowercase"""
+        for location, timezone_key in self.timezone_mapping.items():
+            if location in text:
+                print(f"📍 Time module {match_kind} match found: {location.title()}")
+                return "specified", location.title(), timezone_key
+        
+        fuzzy_result = self._fuzzy_match_lowered(text)
+        if fuzzy_result:
+            location, confidence, timezone_key = fuzzy_result
+            print(f"📍 Time module fuzzy matched '{location}' with {confidence}% confidence")
+            return "specified", location.title(), timezone_key
+        
+        return None
+
     def get_time_summary(self, location_type: str, location_name: str, timezone_key: str) -> str:
         """
         Get time summary for the specified location.
@@ -243,13 +256,11 @@ class TimeModule:
     def _create_time_summary(self, current_time: datetime.datetime, location: str, location_type: str) -> str:
         """Create a natural language time summary"""
         
-        # Format time components
-        day_name = current_time.strftime('%A')
-        month_name = current_time.strftime('%B')
+        # Format time components; the fields only depend on the wall clock
+        day_name, month_name, time_12hr, time_24hr = _format_clock(
+            current_time.replace(tzinfo=None, microsecond=0))
         day_number = current_time.day
         year = current_time.year
-        time_12hr = current_time.strftime('%I:%M %p').lstrip('0')  # Remove leading zero
-        time_24hr = current_time.strftime('%H:%M')
         
         # Get time of day context
         hour = current_time.hour
@@ -1,10 +1,12 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import threading
+import queue
 import time
 import sys
 import os
-import configparser
+import re
+from contextlib import contextmanager
 
 # Add the core directory to Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -19,6 +21,60 @@ except ImportError as e:
     print("Please make sure core/layer.py exists")
     sys.exit(1)
 
+# Rule drawn under each chat message
+_SEPARATOR_LINE = "─" * 60 + "\n"
+
+# (text template, tag) pairs inserted by add_message for each sender
+_MESSAGE_PARTS = {
+    # User message - RIGHT ALIGNED, header with timestamp and "You:"
+    'user': (("\n", 'system'), ("[{timestamp}] ", 'user_timestamp'), ("You: ", 'user_header'),
+             ("{message}\n", 'user_msg'), (_SEPARATOR_LINE, 'separator')),
+    # Bot message - LEFT ALIGNED, header with timestamp and model name
+    'bot': (("\n", 'system'), ("[{timestamp}] ", 'bot_timestamp'), ("{model}: ", 'bot_header'),
+            ("{message}\n", 'bot_msg'), (_SEPARATOR_LINE, 'separator')),
+    'system': (("\n{message}\n", 'system'),),
+    'thinking': (("{message}", 'thinking'),),
+    'context': (("🔍 {message}\n", 'context'),),
+    'stats': (("📈 {message}\n", 'stats'),),
+    'error': (("⚠️ {message}\n", 'error'),),
+    'match_info': (("{message}\n", 'system'),),
+    'correction': (("{message}\n", 'system'),),
+}
+
+# config.cfg only needs section headers and "key = value" (or "key: value") lines
+_SECTION_RE = re.compile(r'^\[([^\]]+)\]\s*$')
+_KV_RE = re.compile(r'^\s*([^=:;#\s][^=:]*?)\s*[=:]\s*(.*?)\s*$')
+
+def _merge_config_text(config, text):
+    """Merge INI text into a {section: {key: value}} dict, overriding existing values"""
+    section = None
+    for line in text.splitlines():
+        match = _SECTION_RE.match(line)
+        if match:
+            section = config.setdefault(match.group(1), {})
+            continue
+        match = _KV_RE.match(line)
+        if match and section is not None:
+            # ConfigParser lowercases option names, so lookups stay compatible
+            section[match.group(1).lower()] = match.group(2)
+    return config
+
+# Parsed config.cfg contents per path, with the mtime they were read at
+_CONFIG_CACHE = {}
+
+def _read_config_file(path):
+    """Return the parsed sections of path, or None if it does not exist; reparsed only when its mtime changes"""
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    cached = _CONFIG_CACHE.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path, encoding="utf-8") as f:
+            cached = (mtime, _merge_config_text({}, f.read()))
+        _CONFIG_CACHE[path] = cached
+    return cached[1]
+
 class DarkChatbotGUI:
     def __init__(self, root):
         self.root = root
@@ -28,8 +84,8 @@ class DarkChatbotGUI:
         self.config = self.load_configuration()
         
         # Set window size from config
-        window_width = self.config.getint('gui', 'window_width', fallback=1000)
-        window_height = self.config.getint('gui', 'window_height', fallback=700)
+        window_width = int(self.config['gui'].get('window_width', 1000))
+        window_height = int(self.config['gui'].get('window_height', 700))
         self.root.geometry(f"{window_width}x{window_height}")
         
         self.root.configure(bg='#0f0f23')
@@ -77,6 +133,7 @@ class DarkChatbotGUI:
         # Initialize streaming layer with configuration
         self.streaming_layer = create_streaming_layer(
             config_file="config.cfg",
+            preparsed_config=_read_config_file("config.cfg"),
             streaming_callback=self._handle_streaming,
             thinking_callback=self._handle_thinking,
             response_complete_callback=self._handle_response_complete,
@@ -88,10 +145,21 @@ class DarkChatbotGUI:
         self.is_processing = False
         self.current_streaming_text = ""
         self.is_streaming = False
+        # (minute since epoch, "HH:MM") for message timestamps
+        self._ts_cache = (0, "")
+        
+        # Worker threads hand streamed text (str) and UI actions (callables) to the Tk thread here
+        self._ui_queue = queue.Queue()
+        # One long-lived daemon thread runs queued jobs off the Tk thread; being a
+        # daemon it never keeps the process alive after the window closes
+        self._work_queue = queue.Queue()
+        threading.Thread(target=self._run_worker, name="edgar-worker", daemon=True).start()
         
         self.setup_gui()
+        self.root.after(33, self._drain_ui_queue)
     
     # ===== STREAMING LAYER CALLBACKS =====
+    # The layer calls these from the worker thread, so Tk work is queued for _drain_ui_queue
     
     def _handle_streaming(self, text: str):
         """Handle streaming text from the layer"""
@@ -99,27 +167,27 @@ class DarkChatbotGUI:
     
     def _handle_thinking(self, text: str):
         """Handle thinking indicators from the layer"""
-        self.add_message("thinking", text)
+        self._ui_queue.put(lambda: self.add_message("thinking", text))
     
     def _handle_response_complete(self):
         """Handle response completion from the layer"""
-        self.processing_complete()
+        self._ui_queue.put(self.processing_complete)
     
     def _handle_status_update(self, status: str):
         """Handle status updates from the layer"""
-        self.status_var.set(status)
+        self._ui_queue.put(lambda: self.status_var.set(status))
     
     def _handle_error(self, error: str):
         """Handle errors from the layer"""
-        self.add_message("error", error)
-        messagebox.showerror("Error", error)
+        def show():
+            self.add_message("error", error)
+            messagebox.showerror("Error", error)
+        self._ui_queue.put(show)
     
     def load_configuration(self):
-        """Load configuration from config file"""
-        config = configparser.ConfigParser()
-        
+        """Load configuration from config file as a {section: {key: value}} dict"""
         # Default configuration
-        defaults = {
+        config = {
             'gui': {
                 'theme': 'dark',
                 'window_width': '1000',
@@ -128,16 +196,11 @@ class DarkChatbotGUI:
             }
         }
         
-        # Set defaults
-        for section, options in defaults.items():
-            if not config.has_section(section):
-                config.add_section(section)
-            for key, value in options.items():
-                config.set(section, key, value)
-        
         # Load from file if exists
-        if os.path.exists("config.cfg"):
-            config.read("config.cfg")
+        file_config = _read_config_file("config.cfg")
+        if file_config is not None:
+            for section, options in file_config.items():
+                config.setdefault(section, {}).update(options)
             print("✅ Loaded GUI configuration from config.cfg")
         else:
             print("⚠️  config.cfg not found, using default GUI configuration")
@@ -565,47 +628,35 @@ How can I assist you today?"""
         
         self.add_message("system", welcome_text)
     
-    def add_message(self, sender, message, tag=None):
+    @contextmanager
+    def _editable(self):
+        """Make the chat display writable for the duration of the block"""
         self.chat_display.config(state=tk.NORMAL)
-        
-        timestamp = time.strftime("%H:%M")
-        current_model = self.streaming_layer.get_current_model()
-        
-        if sender == "user":
-            # User message - RIGHT ALIGNED
-            self.chat_display.insert(tk.END, f"\n", 'system')
-            # Header with timestamp and "You:" on the RIGHT
-            self.chat_display.insert(tk.END, f"[{timestamp}] ", 'user_timestamp')
-            self.chat_display.insert(tk.END, "You: ", 'user_header')
-            self.chat_display.insert(tk.END, f"{message}\n", 'user_msg')
-            self.chat_display.insert(tk.END, "─" * 60 + "\n", 'separator')
-            
-        elif sender == "bot":
-            # Bot message - LEFT ALIGNED  
-            self.chat_display.insert(tk.END, f"\n", 'system')
-            # Header with timestamp and model name on the LEFT
-            self.chat_display.insert(tk.END, f"[{timestamp}] ", 'bot_timestamp')
-            self.chat_display.insert(tk.END, f"{current_model}: ", 'bot_header')
-            self.chat_display.insert(tk.END, f"{message}\n", 'bot_msg')
-            self.chat_display.insert(tk.END, "─" * 60 + "\n", 'separator')
-            
-        elif sender == "system":
-            self.chat_display.insert(tk.END, f"\n{message}\n", 'system')
-        elif sender == "thinking":
-            self.chat_display.insert(tk.END, f"{message}", 'thinking')
-        elif sender == "context":
-            self.chat_display.insert(tk.END, f"🔍 {message}\n", 'context')
-        elif sender == "stats":
-            self.chat_display.insert(tk.END, f"📈 {message}\n", 'stats')
-        elif sender == "error":
-            self.chat_display.insert(tk.END, f"⚠️ {message}\n", 'error')
-        elif sender == "match_info":
-            self.chat_display.insert(tk.END, f"{message}\n", 'system')
-        elif sender == "correction":
-            self.chat_display.insert(tk.END, f"{message}\n", 'system')
-        
-        self.chat_display.config(state=tk.DISABLED)
-        self.chat_display.see(tk.END)
+        try:
+            yield
+        finally:
+            self.chat_display.config(state=tk.DISABLED)
+    
+    def _now_hm(self):
+        """Current "HH:MM", formatted once per minute"""
+        minute = int(time.time()) // 60
+        if minute != self._ts_cache[0]:
+            self._ts_cache = (minute, time.strftime("%H:%M"))
+        return self._ts_cache[1]
+    
+    def add_message(self, sender, message, tag=None):
+        fields = {'message': message, 'timestamp': self._now_hm()}
+        if sender == "bot":
+            fields['model'] = self.streaming_layer.get_current_model()
+        
+        # Text and tags alternate so the whole message goes in with one insert
+        args = []
+        for template, part_tag in _MESSAGE_PARTS.get(sender, ()):
+            args += (template.format(**fields), part_tag)
+        if args:
+            with self._editable():
+                self.chat_display.insert(tk.END, *args)
+            self.chat_display.see(tk.END)
     
     def send_message(self):
         user_text = self.user_input.get().strip()
@@ -622,34 +673,42 @@ How can I assist you today?"""
         # Display user message
         self.add_message("user", user_text)
         
-        # Process message in separate thread to keep GUI responsive
-        threading.Thread(target=self.process_message, args=(user_text,), daemon=True).start()
+        # Process message on the worker thread to keep GUI responsive
+        self._work_queue.put(lambda: self.process_message(user_text))
+    
+    def _run_worker(self):
+        """Run queued jobs one at a time, for the life of the process"""
+        while True:
+            job = self._work_queue.get()
+            try:
+                job()
+            except Exception as e:
+                print(f"❌ Worker error: {e}")
     
     def process_message(self, user_text):
         try:
             # Show thinking indicator
-            self.root.after(0, lambda: self.add_message("thinking", "🤔 Processing your request..."))
+            self._ui_queue.put(lambda: self.add_message("thinking", "🤔 Processing your request..."))
             
             # Process the message using the streaming layer
             responses = self.streaming_layer.process_message(user_text)
             
             # Clear thinking indicator
-            self.chat_display.config(state=tk.NORMAL)
-            self.chat_display.delete("end-2l", "end-1l")
-            self.chat_display.config(state=tk.DISABLED)
+            self._ui_queue.put(self._clear_thinking)
             
             # Check if we got any responses
             if not responses:
-                self.root.after(0, lambda: self.add_message("bot", "I'm not sure how to respond to that. Could you try rephrasing your question?"))
-                self.root.after(0, self.processing_complete)
+                self._ui_queue.put(lambda: self.add_message("bot", "I'm not sure how to respond to that. Could you try rephrasing your question?"))
+                self._ui_queue.put(self.processing_complete)
                 return
             
             # Update GUI with responses using proper streaming
-            self.root.after(0, lambda: self.display_responses_with_streaming(responses))
+            self._ui_queue.put(lambda: self.display_responses_with_streaming(responses))
             
         except Exception as e:
-            self.root.after(0, lambda: self.add_message("error", f"An error occurred: {str(e)}"))
-            self.root.after(0, self.processing_complete)
+            error_msg = f"An error occurred: {str(e)}"
+            self._ui_queue.put(lambda: self.add_message("error", error_msg))
+            self._ui_queue.put(self.processing_complete)
     
     def display_responses_with_streaming(self, responses):
         """Display responses using the streaming layer"""
@@ -661,7 +720,7 @@ How can I assist you today?"""
                 self.add_message("context", context_summary)
             
             # Add separator and move to next response
-            self.add_message("system", "─" * 60)
+            self.add_message("system", _SEPARATOR_LINE.rstrip())
             self.root.after(100, lambda: stream_next_response(current_index + 1))
         
         def stream_next_response(index=0):
@@ -717,13 +776,12 @@ How can I assist you today?"""
             # Display the answer using streaming
             if answer:
                 # Add bot message header
-                timestamp = time.strftime("%H:%M")
+                timestamp = self._now_hm()
                 current_model = self.streaming_layer.get_current_model()
-                self.chat_display.config(state=tk.NORMAL)
-                self.chat_display.insert(tk.END, f"\n", 'system')
-                self.chat_display.insert(tk.END, f"[{timestamp}] ", 'bot_timestamp')
-                self.chat_display.insert(tk.END, f"{current_model}: ", 'bot_header')
-                self.chat_display.config(state=tk.DISABLED)
+                with self._editable():
+                    self.chat_display.insert(tk.END, f"\n", 'system')
+                    self.chat_display.insert(tk.END, f"[{timestamp}] ", 'bot_timestamp')
+                    self.chat_display.insert(tk.END, f"{current_model}: ", 'bot_header')
                 
                 # Stream the response using the streaming layer
                 def stream_response():
@@ -733,11 +791,11 @@ How can I assist you today?"""
                         self.streaming_layer.streaming_speed
                     )
                     
-                    # After streaming completes, show additional info and move to next response
-                    self.root.after(100, lambda: show_additional_info_and_continue(index))
+                    # After the streamed text is drained, show additional info and move to next response
+                    self._ui_queue.put(lambda: self.root.after(100, lambda: show_additional_info_and_continue(index)))
                 
-                # Start streaming in a separate thread
-                threading.Thread(target=stream_response, daemon=True).start()
+                # Stream on the worker thread; processing for this message has already finished there
+                self._work_queue.put(stream_response)
             else:
                 # No answer, move to next response immediately
                 self.root.after(100, lambda: stream_next_response(index + 1))
@@ -746,11 +804,46 @@ How can I assist you today?"""
         stream_next_response()
     
     def stream_to_display(self, text):
-        """Stream text to the main display"""
-        self.chat_display.config(state=tk.NORMAL)
-        self.chat_display.insert(tk.END, text)
-        self.chat_display.config(state=tk.DISABLED)
-        self.chat_display.see(tk.END)
+        """Queue streamed text; it is written to the display in batches by _drain_ui_queue"""
+        self._ui_queue.put(text)
+    
+    def _drain_ui_queue(self):
+        """Apply everything worker threads queued since the last poll, then poll again"""
+        parts = []
+        streamed = False
+        try:
+            while True:
+                try:
+                    item = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(item, str):
+                    parts.append(item)
+                    continue
+                # Text queued before an action is shown before it runs
+                if parts:
+                    self._insert_stream("".join(parts))
+                    parts = []
+                    streamed = True
+                item()
+            if parts:
+                self._insert_stream("".join(parts))
+                streamed = True
+            # Scroll once per poll rather than once per streamed batch
+            if streamed:
+                self.chat_display.see(tk.END)
+        finally:
+            self.root.after(33, self._drain_ui_queue)
+    
+    def _insert_stream(self, text):
+        """Write a batch of streamed fragments to the display in one insert"""
+        with self._editable():
+            self.chat_display.insert(tk.END, text, 'bot_msg')
+    
+    def _clear_thinking(self):
+        """Remove the thinking indicator line"""
+        with self._editable():
+            self.chat_display.delete("end-2l", "end-1l")
     
     def processing_complete(self):
         """Called when message processing is complete"""
@@ -794,9 +887,8 @@ How can I assist you today?"""
             self.streaming_layer.reset_conversation()
             
             # Clear chat display
-            self.chat_display.config(state=tk.NORMAL)
-            self.chat_display.delete(1.0, tk.END)
-            self.chat_display.config(state=tk.DISABLED)
+            with self._editable():
+                self.chat_display.delete(1.0, tk.END)
             
             # Show welcome message again
             self.display_welcome()
@@ -826,8 +918,8 @@ AI Engine:
 • Speed Limiting: {'Enabled' if config['speed_limit'] else 'Disabled'}
 
 GUI:
-• Window Size: {self.config.get('gui', 'window_width')}x{self.config.get('gui', 'window_height')}
-• Theme: {self.config.get('gui', 'theme')}
+• Window Size: {self.config['gui']['window_width']}x{self.config['gui']['window_height']}
+• Theme: {self.config['gui']['theme']}
 
 All settings are stored in config.cfg"""
         
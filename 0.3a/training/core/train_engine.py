@@ -1,6 +1,59 @@
+import bisect
 import json
+import mmap
 import os
 import datetime
+import threading
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _loads(raw):
+    """Parse model JSON from bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _load_file(path):
+    """Parse a model file, letting orjson read straight from a memory map"""
+    with open(path, 'rb') as f:
+        if ORJSON_AVAILABLE:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                mm = None  # empty file or mmap not supported here
+            if mm is not None:
+                with mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+        return _loads(f.read())
+
+def _dumps(data):
+    """Serialize model data to indented JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    # Encode the whole document up front so it reaches disk in one write;
+    # ensure_ascii=False keeps non-ASCII text as plain UTF-8 like orjson does
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _now_iso():
+    """Current local time as ISO-8601, to the second"""
+    return datetime.datetime.now().isoformat(timespec='seconds')
+
+def _atomic_write_bytes(path, data):
+    """Write data to a sibling temp file and swap it into place"""
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb', buffering=0) as f:
+            f.write(data)
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 class ModelManager:
     def __init__(self, parent, on_model_change=None):
@@ -10,65 +63,133 @@ class ModelManager:
         self.models_folder = "models"
         self.current_model = None
         self.available_models = []
+        # Same names as available_models, for constant-time membership checks
+        self._model_set = set()
+        # Model metadata keyed by name: (st_mtime_ns, header), where header is the
+        # file's top-level dict with the groups left out
+        self._headers = {}
+        # Writes can come from the Tk thread and the background I/O pool
+        self._write_lock = threading.Lock()
+        # Model name -> Event set once a write handed to the pool has finished
+        self._inflight = {}
+        # (widget, after_id, name, run) for a debounced save that hasn't fired yet
+        self._pending_save = None
         
         os.makedirs(self.models_folder, exist_ok=True)
         self.load_available_models()
     
     def load_available_models(self):
         """Load all available models from the models folder"""
-        self.available_models = []
-        if os.path.exists(self.models_folder):
-            for file in os.listdir(self.models_folder):
-                if file.endswith('.json'):
-                    model_name = file[:-5]
-                    self.available_models.append(model_name)
-        self.available_models.sort()
+        try:
+            with os.scandir(self.models_folder) as entries:
+                self._model_set = {
+                    entry.name[:-5] for entry in entries
+                    if entry.name.endswith('.json') and entry.is_file()
+                }
+        except FileNotFoundError:
+            self._model_set = set()
+        self.available_models = sorted(self._model_set)
     
     def get_model_path(self, model_name):
         return os.path.join(self.models_folder, f"{model_name}.json")
     
-    def create_model(self, name, description="", author="", version="1.0.0"):
+    def _remember_header(self, name, model_data, mtime):
+        header = dict(model_data)
+        header['qa_groups'] = []  # keeps the key order without holding the groups
+        self._headers[name] = (mtime, header)
+    
+    def _read_model(self, name):
+        """Parse the model file; the result belongs to the caller"""
+        model_path = self.get_model_path(name)
+        # Taken before reading, so a write that lands mid-read only causes a re-read later
+        mtime = os.stat(model_path).st_mtime_ns
+        model_data = _load_file(model_path)
+        self._remember_header(name, model_data, mtime)
+        return model_data
+    
+    def _read_header(self, name):
+        """Return a copy of the model's metadata, parsing the file only if it changed on disk"""
+        mtime = os.stat(self.get_model_path(name)).st_mtime_ns
+        cached = self._headers.get(name)
+        if cached is None or cached[0] != mtime:
+            self._read_model(name)
+            cached = self._headers[name]
+        return dict(cached[1])
+    
+    def write_model(self, name, model_data):
+        """Write the model file and remember its metadata"""
+        model_path = self.get_model_path(name)
+        # Serialized up front, so the bytes written are fixed before taking the lock
+        payload = _dumps(model_data)
+        with self._write_lock:
+            _atomic_write_bytes(model_path, payload)
+            self._remember_header(name, model_data, os.stat(model_path).st_mtime_ns)
+    
+    def background_write(self, name, model_data):
+        """Return a job that writes model_data; saves of name wait until it has run
+
+        Call this on the thread that does the saves, before handing the job to a worker,
+        so a later save cannot overtake the background write.
+        """
+        done = threading.Event()
+        self._inflight[name] = done
+        
+        def job():
+            try:
+                self.write_model(name, model_data)
+            finally:
+                done.set()
+                if self._inflight.get(name) is done:
+                    del self._inflight[name]
+        
+        return job
+    
+    def build_model(self, name, description="", author="", version="1.0.0"):
+        """Validate the name and return the data for a new model, without writing it"""
         if not name.strip():
             raise ValueError("Model name cannot be empty")
         
-        if name in self.available_models:
+        if name in self._model_set:
             raise ValueError(f"Model '{name}' already exists")
         
-        model_data = {
+        return {
             'name': name,
             'description': description,
             'author': author,
             'version': version,
-            'created_at': datetime.datetime.now().isoformat(),
+            'created_at': _now_iso(),
             'qa_groups': []
         }
-        
-        model_path = self.get_model_path(name)
-        with open(model_path, 'w', encoding='utf-8') as f:
-            json.dump(model_data, f, indent=2)
-        
-        self.load_available_models()
+    
+    def add_model(self, name):
+        """Register a model whose file has been written and make it current"""
+        # The new name is known, no need to rescan the folder
+        if name not in self._model_set:
+            self._model_set.add(name)
+            bisect.insort(self.available_models, name)
         self.current_model = name
+    
+    def create_model(self, name, description="", author="", version="1.0.0"):
+        model_data = self.build_model(name, description, author, version)
+        self.write_model(name, model_data)
+        self.add_model(name)
         return model_data
     
     def load_model(self, name):
-        if name not in self.available_models:
+        if name not in self._model_set:
             raise ValueError(f"Model '{name}' not found")
         
-        model_path = self.get_model_path(name)
-        with open(model_path, 'r', encoding='utf-8') as f:
-            model_data = json.load(f)
+        model_data = self._read_model(name)
         
         self.current_model = name
         return model_data
     
-    def update_model_info(self, name, description="", author="", version=""):
-        if name not in self.available_models:
+    def build_model_info(self, name, description="", author="", version=""):
+        """Return a copy of the saved model with new metadata, without writing it"""
+        if name not in self._model_set:
             raise ValueError(f"Model '{name}' not found")
         
-        model_path = self.get_model_path(name)
-        with open(model_path, 'r', encoding='utf-8') as f:
-            model_data = json.load(f)
+        model_data = self._read_model(name)
         
         if description is not None:
             model_data['description'] = description
@@ -77,44 +198,81 @@ class ModelManager:
         if version is not None:
             model_data['version'] = version
         
-        model_data['updated_at'] = datetime.datetime.now().isoformat()
-        
-        with open(model_path, 'w', encoding='utf-8') as f:
-            json.dump(model_data, f, indent=2)
-        
+        model_data['updated_at'] = _now_iso()
+        return model_data
+    
+    def update_model_info(self, name, description="", author="", version=""):
+        model_data = self.build_model_info(name, description, author, version)
+        self.write_model(name, model_data)
         return model_data
     
     def save_model(self, name, qa_groups):
-        model_path = self.get_model_path(name)
-        
-        if os.path.exists(model_path):
-            with open(model_path, 'r', encoding='utf-8') as f:
-                model_data = json.load(f)
-        else:
+        # A background write of this model must land first, or its older
+        # groups would overwrite these
+        pending = self._inflight.get(name)
+        if pending is not None:
+            pending.wait()
+        
+        # Only the metadata is needed, and _read_header already stats the file,
+        # so a missing file is caught here without a separate exists() check
+        try:
+            model_data = self._read_header(name)
+        except FileNotFoundError:
             model_data = {
                 'name': name,
                 'description': f"Model {name}",
                 'author': "",
                 'version': "1.0.0",
-                'created_at': datetime.datetime.now().isoformat(),
+                'created_at': _now_iso(),
                 'qa_groups': []
             }
         
         model_data['qa_groups'] = qa_groups
-        model_data['updated_at'] = datetime.datetime.now().isoformat()
+        model_data['updated_at'] = _now_iso()
         
-        with open(model_path, 'w', encoding='utf-8') as f:
-            json.dump(model_data, f, indent=2)
+        self.write_model(name, model_data)
         
         return model_data
     
+    def schedule_save(self, widget, name, qa_groups, delay_ms=500, on_error=None):
+        """Coalesce saves that arrive within delay_ms of each other into one write"""
+        if self._pending_save is not None:
+            if self._pending_save[2] == name:
+                pending_widget, after_id = self._pending_save[:2]
+                pending_widget.after_cancel(after_id)
+                self._pending_save = None
+            else:
+                self.flush_pending_save()
+        
+        def run():
+            self._pending_save = None
+            try:
+                self.save_model(name, qa_groups)
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(e)
+        
+        after_id = widget.after(delay_ms, run)
+        self._pending_save = (widget, after_id, name, run)
+    
+    def flush_pending_save(self):
+        """Run a debounced save right away, if one is waiting"""
+        if self._pending_save is None:
+            return
+        widget, after_id, name, run = self._pending_save
+        widget.after_cancel(after_id)
+        run()
+    
     def delete_model(self, name):
-        if name not in self.available_models:
+        if name not in self._model_set:
             raise ValueError(f"Model '{name}' not found")
         
         model_path = self.get_model_path(name)
         os.remove(model_path)
-        self.load_available_models()
+        self._headers.pop(name, None)
+        self._model_set.discard(name)
+        self.available_models.remove(name)
         
         if self.current_model == name:
             self.current_model = None
@@ -148,6 +306,17 @@ class TrainingEngine:
             raise ValueError("No model selected")
         return self.model_manager.save_model(self.current_model, self.qa_groups)
     
+    def schedule_save_current_model(self, widget, on_error=None):
+        """Debounced save of the current model, written from widget's event loop"""
+        if not self.current_model:
+            raise ValueError("No model selected")
+        self.model_manager.schedule_save(widget, self.current_model, self.qa_groups, on_error=on_error)
+    
+    def flush_pending_save(self):
+        """Write any debounced save immediately"""
+        if self.model_manager:
+            self.model_manager.flush_pending_save()
+    
     def update_model_info(self, description="", author="", version=""):
         """Update current model information"""
         if not self.current_model:
@@ -282,7 +451,7 @@ class TrainingEngine:
         
         # Update with current QA groups (in case there are unsaved changes)
         model_data['qa_groups'] = self.qa_groups
-        model_data['exported_at'] = datetime.datetime.now().isoformat()
+        model_data['exported_at'] = _now_iso()
         
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(model_data, f, indent=2, ensure_ascii=False)
@@ -1,17 +1,89 @@
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, filedialog
+from tkinter import ttk, scrolledtext, messagebox
 import json
 import datetime
 import os
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from core.train_engine import TrainingEngine, ModelManager
 
+# Single worker so model file writes run off the Tk thread but stay in order
+_IO_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-io")
+
+def run_in_background(widget, func, on_done, poll_ms=20):
+    """Run func on the I/O pool; the Tk thread polls for it and calls on_done(result, error)
+
+    func must only work on data it owns, never on state the Tk thread keeps using.
+    """
+    future = _IO_POOL.submit(func)
+    
+    def check():
+        if not future.done():
+            widget.after(poll_ms, check)
+            return
+        error = future.exception()
+        on_done(None if error else future.result(), error)
+    
+    # Scheduled from the Tk thread, so the worker never touches Tk itself
+    widget.after(poll_ms, check)
+    return future
+
+# Window palette shared by every dialog and panel
+THEME = {
+    'bg': '#1a1a2e',
+    'panel': '#252547',
+    'surface': '#2d2d5a',
+    'raised': '#3d2d5a',
+    'accent': '#6c63ff',
+    'success': '#00ff88',
+    'danger': '#ff4d7d',
+    'info': '#00d4ff',
+    'muted': '#b0b0d0',
+}
+
+# Shared widget options for the model dialogs
+_DIALOG_TITLE = dict(font=('Arial', 16, 'bold'), bg=THEME['surface'], fg='white')
+_LABEL_BOLD = dict(font=('Arial', 11, 'bold'), bg=THEME['surface'], fg='white')
+_ENTRY_DARK = dict(font=('Arial', 11), bg=THEME['bg'], fg='white', insertbackground='white')
+_TEXT_DARK = dict(font=('Arial', 10), bg=THEME['bg'], fg='white', insertbackground='white', wrap=tk.WORD)
+
+# Shared widget options for the editor panels and their buttons
+_PANEL_LABEL = dict(font=('Arial', 11, 'bold'), bg=THEME['panel'], fg='white')
+_PANEL_TEXT = dict(_TEXT_DARK, padx=10, pady=10)
+_SMALL_BUTTON = dict(font=('Arial', 9, 'bold'), padx=12, pady=4)
+_ACTION_BUTTON = dict(font=('Arial', 11, 'bold'), padx=25, pady=10)
+_LIST_BUTTON = dict(font=('Arial', 9), width=8)
+
+def _grid(frame, rows=(), cols=()):
+    """Give grid rows/columns their weights; zero entries keep Tk's default"""
+    for index, weight in enumerate(rows):
+        if weight:
+            frame.grid_rowconfigure(index, weight=weight)
+    for index, weight in enumerate(cols):
+        if weight:
+            frame.grid_columnconfigure(index, weight=weight)
+
+def _set_text(widget, text):
+    """Replace a Text widget's whole contents in one Tcl command"""
+    try:
+        widget.replace('1.0', tk.END, text)
+    except tk.TclError:  # Tk without "text replace"
+        widget.delete('1.0', tk.END)
+        widget.insert('1.0', text)
+
+def _parse_geometry(geometry):
+    """Split a Tk "WxH+X+Y" string so one winfo call replaces four"""
+    size, x, y = geometry.split('+', 2)
+    width, height = size.split('x')
+    return int(width), int(height), int(x), int(y)
+
 class BaseDialog:
     """Base class for dialogs with common functionality"""
     def __init__(self, parent, title, width=500, height=400):
         self.window = tk.Toplevel(parent)
         self.window.title(title)
         self.window.geometry(f"{width}x{height}")
-        self.window.configure(bg='#2d2d5a')
+        self.window.configure(bg=THEME['surface'])
         self.window.minsize(400, 300)
         
         self.window.transient(parent)
@@ -20,10 +92,12 @@ class BaseDialog:
         self.window.bind('<Escape>', lambda e: self.window.destroy())
     
     def center_window(self, parent):
+        # update_idletasks() only settles pending geometry; don't use update()
+        # here, it would also run queued events while the dialog is half built
         self.window.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() // 2) - (self.window.winfo_width() // 2)
-        y = parent.winfo_y() + (parent.winfo_height() // 2) - (self.window.winfo_height() // 2)
-        self.window.geometry(f"+{x}+{y}")
+        pw, ph, px, py = _parse_geometry(parent.winfo_geometry())
+        ww, wh, _, _ = _parse_geometry(self.window.winfo_geometry())
+        self.window.geometry(f"+{px + (pw - ww) // 2}+{py + (ph - wh) // 2}")
 
 class CreateModelDialog(BaseDialog):
     def __init__(self, parent, on_create=None):
@@ -42,96 +116,57 @@ class CreateModelDialog(BaseDialog):
         tk.Label(
             self.window,
             text="Create New AI Model",
-            font=('Arial', 16, 'bold'),
-            bg='#2d2d5a',
-            fg='white'
+            **_DIALOG_TITLE
         ).grid(row=0, column=0, sticky='w', padx=20, pady=(20, 10))
         
         # Main content frame
-        content_frame = tk.Frame(self.window, bg='#2d2d5a')
+        content_frame = tk.Frame(self.window, bg=THEME['surface'])
         content_frame.grid(row=1, column=0, sticky='nsew', padx=20, pady=10)
         content_frame.grid_columnconfigure(1, weight=1)
         
         # Model name
-        tk.Label(
-            content_frame,
-            text="Model Name:",
-            font=('Arial', 11, 'bold'),
-            bg='#2d2d5a',
-            fg='white'
-        ).grid(row=0, column=0, sticky='w', pady=(0, 8))
+        tk.Label(content_frame, text="Model Name:", **_LABEL_BOLD).grid(row=0, column=0, sticky='w', pady=(0, 8))
         
         self.name_var = tk.StringVar()
         self.name_entry = tk.Entry(
             content_frame,
             textvariable=self.name_var,
-            font=('Arial', 11),
-            bg='#1a1a2e',
-            fg='white',
-            insertbackground='white'
+            **_ENTRY_DARK
         )
         self.name_entry.grid(row=0, column=1, sticky='ew', pady=(0, 15))
         self.name_entry.bind('<Return>', lambda e: self.create_model())
         
         # Author
-        tk.Label(
-            content_frame,
-            text="Author:",
-            font=('Arial', 11, 'bold'),
-            bg='#2d2d5a',
-            fg='white'
-        ).grid(row=1, column=0, sticky='w', pady=(0, 8))
+        tk.Label(content_frame, text="Author:", **_LABEL_BOLD).grid(row=1, column=0, sticky='w', pady=(0, 8))
         
         self.author_var = tk.StringVar()
         self.author_entry = tk.Entry(
             content_frame,
             textvariable=self.author_var,
-            font=('Arial', 11),
-            bg='#1a1a2e',
-            fg='white',
-            insertbackground='white'
+            **_ENTRY_DARK
         )
         self.author_entry.grid(row=1, column=1, sticky='ew', pady=(0, 15))
         self.author_entry.bind('<Return>', lambda e: self.create_model())
         
         # Version
-        tk.Label(
-            content_frame,
-            text="Version:",
-            font=('Arial', 11, 'bold'),
-            bg='#2d2d5a',
-            fg='white'
-        ).grid(row=2, column=0, sticky='w', pady=(0, 8))
+        tk.Label(content_frame, text="Version:", **_LABEL_BOLD).grid(row=2, column=0, sticky='w', pady=(0, 8))
         
         self.version_var = tk.StringVar(value="1.0.0")
         self.version_entry = tk.Entry(
             content_frame,
             textvariable=self.version_var,
-            font=('Arial', 11),
-            bg='#1a1a2e',
-            fg='white',
-            insertbackground='white'
+            **_ENTRY_DARK
         )
         self.version_entry.grid(row=2, column=1, sticky='ew', pady=(0, 15))
         self.version_entry.bind('<Return>', lambda e: self.create_model())
         
         # Description
-        tk.Label(
-            content_frame,
-            text="Description:",
-            font=('Arial', 11, 'bold'),
-            bg='#2d2d5a',
-            fg='white'
-        ).grid(row=3, column=0, sticky='nw', pady=(0, 8))
+        tk.Label(content_frame, text="Description:", **_LABEL_BOLD).grid(row=3, column=0, sticky='nw', pady=(0, 8))
         
         self.desc_text = scrolledtext.ScrolledText(
             content_frame,
             height=4,
-            font=('Arial', 10),
-            bg='#1a1a2e',
-            fg='white',
-            insertbackground='white',
-            wrap=tk.WORD
+            **_TEXT_DARK
         )
         self.desc_text.grid(row=3, column=1, sticky='nsew', pady=(0, 15))
         
@@ -140,14 +175,14 @@ class CreateModelDialog(BaseDialog):
         self.desc_text.bind('<Return>', self.on_description_enter)
         
         # Buttons frame
-        button_frame = tk.Frame(self.window, bg='#2d2d5a')
+        button_frame = tk.Frame(self.window, bg=THEME['surface'])
         button_frame.grid(row=2, column=0, sticky='e', padx=20, pady=(0, 20))
         
         self.create_button = tk.Button(
             button_frame,
             text="💾 Create Model",
             command=self.create_model,
-            bg='#00ff88',
+            bg=THEME['success'],
             fg='black',
             font=('Arial', 10, 'bold'),
             padx=20,
@@ -159,7 +194,7 @@ class CreateModelDialog(BaseDialog):
             button_frame,
             text="❌ Cancel",
             command=self.window.destroy,
-            bg='#ff4d7d',
+            bg=THEME['danger'],
             fg='white',
             font=('Arial', 10, 'bold'),
             padx=20,
@@ -183,7 +218,7 @@ class CreateModelDialog(BaseDialog):
             
         self.creating = True
         self.create_button.config(state='disabled', text="Creating...")
-        self.window.update()
+        self.window.update_idletasks()
         
         try:
             name = self.name_var.get().strip()
@@ -230,31 +265,23 @@ class EditModelDialog(BaseDialog):
         tk.Label(
             self.window,
             text="Edit Model Information",
-            font=('Arial', 16, 'bold'),
-            bg='#2d2d5a',
-            fg='white'
+            **_DIALOG_TITLE
         ).grid(row=0, column=0, sticky='w', padx=20, pady=(20, 10))
         
         # Main content frame
-        content_frame = tk.Frame(self.window, bg='#2d2d5a')
+        content_frame = tk.Frame(self.window, bg=THEME['surface'])
         content_frame.grid(row=1, column=0, sticky='nsew', padx=20, pady=10)
         content_frame.grid_columnconfigure(1, weight=1)
         
         # Model name (read-only)
-        tk.Label(
-            content_frame,
-            text="Model Name:",
-            font=('Arial', 11, 'bold'),
-            bg='#2d2d5a',
-            fg='white'
-        ).grid(row=0, column=0, sticky='w', pady=(0, 8))
+        tk.Label(content_frame, text="Model Name:", **_LABEL_BOLD).grid(row=0, column=0, sticky='w', pady=(0, 8))
         
         self.name_var = tk.StringVar()
         name_display = tk.Label(
             content_frame,
             textvariable=self.name_var,
             font=('Arial', 11),
-            bg='#1a1a2e',
+            bg=THEME['bg'],
             fg='white',
             anchor='w',
             relief='sunken',
@@ -265,60 +292,32 @@ class EditModelDialog(BaseDialog):
         name_display.grid(row=0, column=1, sticky='ew', pady=(0, 15))
         
         # Author
-        tk.Label(
-            content_frame,
-            text="Author:",
-            font=('Arial', 11, 'bold'),
-            bg='#2d2d5a',
-            fg='white'
-        ).grid(row=1, column=0, sticky='w', pady=(0, 8))
+        tk.Label(content_frame, text="Author:", **_LABEL_BOLD).grid(row=1, column=0, sticky='w', pady=(0, 8))
         
         self.author_var = tk.StringVar()
         tk.Entry(
             content_frame,
             textvariable=self.author_var,
-            font=('Arial', 11),
-            bg='#1a1a2e',
-            fg='white',
-            insertbackground='white'
+            **_ENTRY_DARK
         ).grid(row=1, column=1, sticky='ew', pady=(0, 15))
         
         # Version
-        tk.Label(
-            content_frame,
-            text="Version:",
-            font=('Arial', 11, 'bold'),
-            bg='#2d2d5a',
-            fg='white'
-        ).grid(row=2, column=0, sticky='w', pady=(0, 8))
+        tk.Label(content_frame, text="Version:", **_LABEL_BOLD).grid(row=2, column=0, sticky='w', pady=(0, 8))
         
         self.version_var = tk.StringVar()
         tk.Entry(
             content_frame,
             textvariable=self.version_var,
-            font=('Arial', 11),
-            bg='#1a1a2e',
-            fg='white',
-            insertbackground='white'
+            **_ENTRY_DARK
         ).grid(row=2, column=1, sticky='ew', pady=(0, 15))
         
         # Description
-        tk.Label(
-            content_frame,
-            text="Description:",
-            font=('Arial', 11, 'bold'),
-            bg='#2d2d5a',
-            fg='white'
-        ).grid(row=3, column=0, sticky='nw', pady=(0, 8))
+        tk.Label(content_frame, text="Description:", **_LABEL_BOLD).grid(row=3, column=0, sticky='nw', pady=(0, 8))
         
         self.desc_text = scrolledtext.ScrolledText(
             content_frame,
             height=4,
-            font=('Arial', 10),
-            bg='#1a1a2e',
-            fg='white',
-            insertbackground='white',
-            wrap=tk.WORD
+            **_TEXT_DARK
         )
         self.desc_text.grid(row=3, column=1, sticky='nsew', pady=(0, 15))
         
@@ -327,14 +326,14 @@ class EditModelDialog(BaseDialog):
         self.desc_text.bind('<Return>', self.on_description_enter)
         
         # Buttons frame
-        button_frame = tk.Frame(self.window, bg='#2d2d5a')
+        button_frame = tk.Frame(self.window, bg=THEME['surface'])
         button_frame.grid(row=2, column=0, sticky='e', padx=20, pady=(0, 20))
         
         tk.Button(
             button_frame,
             text="❌ Cancel",
             command=self.window.destroy,
-            bg='#ff4d7d',
+            bg=THEME['danger'],
             fg='white',
             font=('Arial', 10, 'bold'),
             padx=20,
@@ -345,7 +344,7 @@ class EditModelDialog(BaseDialog):
             button_frame,
             text="💾 Save Changes",
             command=self.save_model,
-            bg='#00ff88',
+            bg=THEME['success'],
             fg='black',
             font=('Arial', 10, 'bold'),
             padx=20,
@@ -366,8 +365,7 @@ class EditModelDialog(BaseDialog):
         self.name_var.set(self.model_data.get('name', ''))
         self.author_var.set(self.model_data.get('author', ''))
         self.version_var.set(self.model_data.get('version', '1.0.0'))
-        self.desc_text.delete('1.0', tk.END)
-        self.desc_text.insert('1.0', self.model_data.get('description', ''))
+        _set_text(self.desc_text, self.model_data.get('description', ''))
     
     def save_model(self):
         description = self.desc_text.get('1.0', tk.END).strip()
@@ -403,12 +401,12 @@ class BranchNameDialog(BaseDialog):
             self.window,
             text=title_text,
             font=('Arial', 14, 'bold'),
-            bg='#2d2d5a',
+            bg=THEME['surface'],
             fg='white'
         ).grid(row=0, column=0, sticky='w', padx=20, pady=(20, 10))
         
         # Content frame
-        content_frame = tk.Frame(self.window, bg='#2d2d5a')
+        content_frame = tk.Frame(self.window, bg=THEME['surface'])
         content_frame.grid(row=1, column=0, sticky='nsew', padx=20, pady=10)
         content_frame.grid_columnconfigure(0, weight=1)
         
@@ -418,42 +416,33 @@ class BranchNameDialog(BaseDialog):
             content_frame,
             text=desc_text,
             font=('Arial', 10),
-            bg='#2d2d5a',
-            fg='#b0b0d0',
+            bg=THEME['surface'],
+            fg=THEME['muted'],
             wraplength=400,
             justify=tk.LEFT
         ).grid(row=0, column=0, sticky='w', pady=(0, 15))
         
         # Name entry
-        tk.Label(
-            content_frame,
-            text="Branch Name:",
-            font=('Arial', 11, 'bold'),
-            bg='#2d2d5a',
-            fg='white'
-        ).grid(row=1, column=0, sticky='w', pady=(0, 8))
+        tk.Label(content_frame, text="Branch Name:", **_LABEL_BOLD).grid(row=1, column=0, sticky='w', pady=(0, 8))
         
         self.name_var = tk.StringVar(value=current_name)
         self.name_entry = tk.Entry(
             content_frame,
             textvariable=self.name_var,
-            font=('Arial', 11),
-            bg='#1a1a2e',
-            fg='white',
-            insertbackground='white'
+            **_ENTRY_DARK
         )
         self.name_entry.grid(row=2, column=0, sticky='ew', pady=(0, 20))
         self.name_entry.bind('<Return>', lambda e: self.save_name())
         
         # Buttons
-        button_frame = tk.Frame(self.window, bg='#2d2d5a')
+        button_frame = tk.Frame(self.window, bg=THEME['surface'])
         button_frame.grid(row=2, column=0, sticky='e', padx=20, pady=(0, 20))
         
         tk.Button(
             button_frame,
             text="❌ Cancel",
             command=self.window.destroy,
-            bg='#ff4d7d',
+            bg=THEME['danger'],
             fg='white',
             font=('Arial', 10, 'bold'),
             padx=15,
@@ -464,7 +453,7 @@ class BranchNameDialog(BaseDialog):
             button_frame,
             text="💾 Save Name",
             command=self.save_name,
-            bg='#00ff88',
+            bg=THEME['success'],
             fg='black',
             font=('Arial', 10, 'bold'),
             padx=15,
@@ -502,7 +491,7 @@ class QuestionAnswerEditor(BaseDialog):
         self.text_widget = scrolledtext.ScrolledText(
             self.window, 
             font=('Arial', 11),
-            bg='#1a1a2e', 
+            bg=THEME['bg'], 
             fg='white',
             insertbackground='white',
             wrap=tk.WORD,
@@ -517,7 +506,7 @@ class QuestionAnswerEditor(BaseDialog):
         self.text_widget.bind('<Return>', self.on_enter)
         
         # Button frame
-        button_frame = tk.Frame(self.window, bg='#2d2d5a')
+        button_frame = tk.Frame(self.window, bg=THEME['surface'])
         button_frame.grid(row=1, column=0, sticky='ew', padx=15, pady=(0, 15))
         button_frame.grid_columnconfigure(0, weight=1)
         
@@ -525,8 +514,8 @@ class QuestionAnswerEditor(BaseDialog):
             button_frame,
             text=f"Editing {self.item_type}... (Shift+Enter for new line, Enter to save)",
             font=('Arial', 9),
-            bg='#2d2d5a',
-            fg='#b0b0d0'
+            bg=THEME['surface'],
+            fg=THEME['muted']
         )
         self.status_label.grid(row=0, column=0, sticky='w')
         
@@ -534,7 +523,7 @@ class QuestionAnswerEditor(BaseDialog):
             button_frame, 
             text="❌ Cancel", 
             command=self.window.destroy,
-            bg='#ff4d7d', 
+            bg=THEME['danger'], 
             fg='white',
             font=('Arial', 10, 'bold'),
             padx=15,
@@ -546,7 +535,7 @@ class QuestionAnswerEditor(BaseDialog):
             button_frame, 
             text="💾 Save", 
             command=self.save,
-            bg='#00ff88', 
+            bg=THEME['success'], 
             fg='black',
             font=('Arial', 10, 'bold'),
             padx=15,
@@ -573,33 +562,99 @@ class QuestionAnswerEditor(BaseDialog):
             messagebox.showwarning("Empty", f"Please enter a {self.item_type}.")
             self.text_widget.focus_set()
 
+_styles_done = False
+
+def _configure_styles():
+    """Configure the follow-up Treeview style once per process"""
+    global _styles_done
+    if _styles_done:
+        return
+    
+    style = ttk.Style()
+    style.theme_use('default')
+    style.configure("Treeview",
+        background=THEME['surface'],
+        foreground="white",
+        fieldbackground=THEME['surface'],
+        borderwidth=0)
+    style.configure("Treeview.Heading",
+        background=THEME['panel'],
+        foreground="white")
+    style.map('Treeview', background=[('selected', THEME['accent'])])
+    _styles_done = True
+
+class InlineConfirm:
+    """Confirmation bar laid over the bottom of a frame instead of a modal dialog"""
+    def __init__(self, parent, message, on_confirm, on_cancel=None, confirm_text="Delete"):
+        self.on_confirm = on_confirm
+        self.on_cancel = on_cancel
+        
+        self.frame = tk.Frame(parent, bg=THEME['raised'], padx=10, pady=8)
+        self.frame.place(relx=0, rely=1, relwidth=1, anchor='sw')
+        
+        tk.Label(self.frame, text=message, font=('Arial', 10), bg=THEME['raised'], fg='white',
+                 anchor='w', justify=tk.LEFT).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        tk.Button(self.frame, text="Cancel", command=self.cancel, bg=THEME['surface'], fg='white',
+                  **_SMALL_BUTTON).pack(side=tk.RIGHT)
+        confirm_button = tk.Button(self.frame, text=confirm_text, command=self.confirm,
+                                   bg=THEME['danger'], fg='white', **_SMALL_BUTTON)
+        confirm_button.pack(side=tk.RIGHT, padx=(0, 8))
+        confirm_button.focus_set()
+    
+    def close(self):
+        self.frame.destroy()
+    
+    def confirm(self):
+        self.close()
+        self.on_confirm()
+    
+    def cancel(self):
+        self.close()
+        if self.on_cancel:
+            self.on_cancel()
+
 class FollowUpEditor(BaseDialog):
+    # Row kind is drawn by a tag image, so row text is just the branch name
+    _ICON_COLORS = {'root': THEME['success'], 'child': THEME['accent']}
+    
     def __init__(self, parent, followup_data=None, on_save=None):
         super().__init__(parent, "Follow-up Tree Editor", 900, 650)
+        _configure_styles()
         self.on_save = on_save
         self.followup_data = followup_data or []
         self.selected_node = None
+        # Shadow copy of the tree so saving never has to read back from Tk
+        self.node_data = {}
+        self.children_of = {'': []}
+        self.parent_of = {}
+        # Rows are only created when their parent is expanded; these nodes
+        # still show a placeholder child in place of their real children
+        self._unexpanded = set()
+        self._ids = itertools.count(1)
+        # Pending idle render for <<TreeviewSelect>> and the node it last drew
+        self._select_after_id = None
+        self._last_rendered_node = None
+        self._confirm = None
+        # The editor widgets are built the first time a node is selected
+        self._editor_built = False
         self.setup_ui()
         
         if followup_data:
             self.load_data()
     
     def setup_ui(self):
-        self.window.grid_columnconfigure(0, weight=1)
-        self.window.grid_rowconfigure(0, weight=1)
+        _grid(self.window, rows=[1], cols=[1])
         
-        main_frame = tk.Frame(self.window, bg='#1a1a2e')
+        main_frame = tk.Frame(self.window, bg=THEME['bg'])
         main_frame.grid(row=0, column=0, sticky='nsew', padx=20, pady=20)
-        main_frame.grid_columnconfigure(0, weight=2)
-        main_frame.grid_columnconfigure(1, weight=3)
-        main_frame.grid_rowconfigure(1, weight=1)
+        _grid(main_frame, rows=[0, 1], cols=[2, 3])
         
         # Header
         tk.Label(
             main_frame,
             text="Follow-up Conversation Tree",
             font=('Arial', 16, 'bold'),
-            bg='#1a1a2e',
+            bg=THEME['bg'],
             fg='white'
         ).grid(row=0, column=0, columnspan=2, sticky='w', pady=(0, 15))
         
@@ -613,32 +668,31 @@ class FollowUpEditor(BaseDialog):
         self.setup_action_buttons(main_frame)
     
     def setup_tree_panel(self, parent):
-        tree_frame = tk.Frame(parent, bg='#252547', relief='raised', bd=1)
+        tree_frame = tk.Frame(parent, bg=THEME['panel'], relief='raised', bd=1)
         tree_frame.grid(row=1, column=0, sticky='nsew', padx=(0, 15))
-        tree_frame.grid_columnconfigure(0, weight=1)
-        tree_frame.grid_rowconfigure(1, weight=1)
+        _grid(tree_frame, rows=[0, 1], cols=[1])
         
         # Tree header with buttons
-        tree_header = tk.Frame(tree_frame, bg='#252547')
+        tree_header = tk.Frame(tree_frame, bg=THEME['panel'])
         tree_header.grid(row=0, column=0, sticky='ew', padx=15, pady=12)
-        tree_header.grid_columnconfigure(0, weight=1)
+        _grid(tree_header, cols=[1])
         
         tk.Label(
             tree_header,
             text="Conversation Flow",
             font=('Arial', 12, 'bold'),
-            bg='#252547',
+            bg=THEME['panel'],
             fg='white'
         ).grid(row=0, column=0, sticky='w')
         
-        tree_buttons = tk.Frame(tree_header, bg='#252547')
+        tree_buttons = tk.Frame(tree_header, bg=THEME['panel'])
         tree_buttons.grid(row=0, column=1, sticky='e')
         
         tk.Button(
             tree_buttons,
             text="+ Root",
             command=self.add_root_node,
-            bg='#6c63ff',
+            bg=THEME['accent'],
             fg='white',
             font=('Arial', 9, 'bold'),
             padx=20,
@@ -650,7 +704,7 @@ class FollowUpEditor(BaseDialog):
             tree_buttons,
             text="+ Branch",
             command=self.add_child_node,
-            bg='#00d4ff',
+            bg=THEME['info'],
             fg='black',
             font=('Arial', 9, 'bold'),
             padx=20,
@@ -659,59 +713,66 @@ class FollowUpEditor(BaseDialog):
         ).pack(side=tk.LEFT)
         
         # Tree widget container
-        tree_container = tk.Frame(tree_frame, bg='#252547')
+        tree_container = tk.Frame(tree_frame, bg=THEME['panel'])
         tree_container.grid(row=1, column=0, sticky='nsew', padx=15, pady=(0, 15))
-        tree_container.grid_columnconfigure(0, weight=1)
-        tree_container.grid_rowconfigure(0, weight=1)
-        
-        # Style the treeview
-        style = ttk.Style()
-        style.theme_use('default')
-        style.configure("Treeview",
-            background="#2d2d5a",
-            foreground="white",
-            fieldbackground="#2d2d5a",
-            borderwidth=0)
-        style.configure("Treeview.Heading",
-            background="#252547",
-            foreground="white")
-        style.map('Treeview', background=[('selected', '#6c63ff')])
+        _grid(tree_container, rows=[1], cols=[1])
         
         self.tree = ttk.Treeview(tree_container, show='tree', style="Treeview")
         
         # Use custom scrollbar
         tree_scroll = tk.Scrollbar(tree_container, orient=tk.VERTICAL, command=self.tree.yview,
-                                  bg='#2d2d5a', troughcolor='#1a1a2e', activebackground='#6c63ff')
+                                  bg=THEME['surface'], troughcolor=THEME['bg'], activebackground=THEME['accent'])
         self.tree.configure(yscrollcommand=tree_scroll.set)
         
         self.tree.grid(row=0, column=0, sticky='nsew')
         tree_scroll.grid(row=0, column=1, sticky='ns')
         
+        self._icons = {}
+        for tag, color in self._ICON_COLORS.items():
+            icon = tk.PhotoImage(master=self.window, width=10, height=10)
+            icon.put(color, to=(0, 0, 10, 10))
+            self._icons[tag] = icon  # Tk doesn't hold a Python reference
+            self.tree.tag_configure(tag, image=icon)
+        
         self.tree.bind('<<TreeviewSelect>>', self.on_tree_select)
         self.tree.bind('<Double-1>', self.on_tree_double_click)
+        self.tree.bind('<Delete>', lambda e: self.delete_node())
+        self.tree.bind('<<TreeviewOpen>>', self.on_tree_open)
     
     def setup_editor_panel(self, parent):
-        editor_frame = tk.Frame(parent, bg='#252547', relief='raised', bd=1)
-        editor_frame.grid(row=1, column=1, sticky='nsew')
-        editor_frame.grid_columnconfigure(0, weight=1)
-        editor_frame.grid_rowconfigure(3, weight=1)
-        editor_frame.grid_rowconfigure(4, weight=1)
+        self.editor_frame = tk.Frame(parent, bg=THEME['panel'], relief='raised', bd=1)
+        self.editor_frame.grid(row=1, column=1, sticky='nsew')
+        
+        self._editor_hint = tk.Label(
+            self.editor_frame,
+            text="Select a node to edit its content",
+            font=('Arial', 10),
+            bg=THEME['panel'],
+            fg=THEME['muted']
+        )
+        self._editor_hint.place(relx=0.5, rely=0.5, anchor='center')
+    
+    def _build_editor_panel(self):
+        self._editor_hint.destroy()
+        self._editor_built = True
+        editor_frame = self.editor_frame
+        _grid(editor_frame, rows=[0, 0, 0, 1, 1], cols=[1])
         
         # Branch name section
-        name_frame = tk.Frame(editor_frame, bg='#252547')
+        name_frame = tk.Frame(editor_frame, bg=THEME['panel'])
         name_frame.grid(row=0, column=0, sticky='ew', padx=15, pady=12)
-        name_frame.grid_columnconfigure(0, weight=1)
+        _grid(name_frame, cols=[1])
         
         # Title and edit button
-        title_edit_frame = tk.Frame(name_frame, bg='#252547')
+        title_edit_frame = tk.Frame(name_frame, bg=THEME['panel'])
         title_edit_frame.grid(row=0, column=0, sticky='ew', pady=(0, 8))
-        title_edit_frame.grid_columnconfigure(0, weight=1)
+        _grid(title_edit_frame, cols=[1])
         
         self.node_title = tk.Label(
             title_edit_frame,
             text="No node selected",
             font=('Arial', 13, 'bold'),
-            bg='#252547',
+            bg=THEME['panel'],
             fg='white'
         )
         self.node_title.grid(row=0, column=0, sticky='w')
@@ -721,12 +782,10 @@ class FollowUpEditor(BaseDialog):
             title_edit_frame,
             text="✏️ Edit Name",
             command=self.edit_branch_name,
-            bg='#6c63ff',
+            bg=THEME['accent'],
             fg='white',
-            font=('Arial', 9, 'bold'),
-            padx=12,
-            pady=4,
-            state='disabled'
+            state='disabled',
+            **_SMALL_BUTTON
         )
         self.edit_name_button.grid(row=0, column=1, sticky='e', padx=(0, 8))
         
@@ -735,12 +794,10 @@ class FollowUpEditor(BaseDialog):
             title_edit_frame,
             text="🗑️ Delete",
             command=self.delete_node,
-            bg='#ff4d7d',
+            bg=THEME['danger'],
             fg='white',
-            font=('Arial', 9, 'bold'),
-            padx=12,
-            pady=4,
-            state='disabled'
+            state='disabled',
+            **_SMALL_BUTTON
         )
         self.delete_button.grid(row=0, column=2, sticky='e')
         
@@ -749,8 +806,8 @@ class FollowUpEditor(BaseDialog):
             name_frame,
             text="Select a node to view details",
             font=('Arial', 10),
-            bg='#252547',
-            fg='#b0b0d0'
+            bg=THEME['panel'],
+            fg=THEME['muted']
         )
         self.branch_name_display.grid(row=1, column=0, sticky='w', pady=(2, 0))
         
@@ -759,35 +816,26 @@ class FollowUpEditor(BaseDialog):
             name_frame,
             text="Select a node to edit its content",
             font=('Arial', 9),
-            bg='#252547',
-            fg='#b0b0d0'
+            bg=THEME['panel'],
+            fg=THEME['muted']
         )
         self.node_info.grid(row=2, column=0, sticky='w', pady=(2, 0))
         
         # Question editor
-        q_frame = tk.Frame(editor_frame, bg='#252547')
+        q_frame = tk.Frame(editor_frame, bg=THEME['panel'])
         q_frame.grid(row=3, column=0, sticky='nsew', padx=15, pady=(0, 10))
-        q_frame.grid_columnconfigure(0, weight=1)
-        q_frame.grid_rowconfigure(1, weight=1)
+        _grid(q_frame, rows=[0, 1], cols=[1])
         
         tk.Label(
             q_frame,
             text="User's Follow-up Question:",
-            font=('Arial', 11, 'bold'),
-            bg='#252547',
-            fg='white'
+            **_PANEL_LABEL
         ).grid(row=0, column=0, sticky='w', pady=(0, 8))
         
         self.question_text = scrolledtext.ScrolledText(
             q_frame,
             height=5,
-            font=('Arial', 10),
-            bg='#1a1a2e',
-            fg='white',
-            insertbackground='white',
-            wrap=tk.WORD,
-            padx=10,
-            pady=10
+            **_PANEL_TEXT
         )
         self.question_text.grid(row=1, column=0, sticky='nsew')
         
@@ -796,29 +844,20 @@ class FollowUpEditor(BaseDialog):
         self.question_text.bind('<Return>', self.on_enter)
         
         # Answer editor
-        a_frame = tk.Frame(editor_frame, bg='#252547')
+        a_frame = tk.Frame(editor_frame, bg=THEME['panel'])
         a_frame.grid(row=4, column=0, sticky='nsew', padx=15, pady=(0, 10))
-        a_frame.grid_columnconfigure(0, weight=1)
-        a_frame.grid_rowconfigure(1, weight=1)
+        _grid(a_frame, rows=[0, 1], cols=[1])
         
         tk.Label(
             a_frame,
             text="AI's Response:",
-            font=('Arial', 11, 'bold'),
-            bg='#252547',
-            fg='white'
+            **_PANEL_LABEL
         ).grid(row=0, column=0, sticky='w', pady=(0, 8))
         
         self.answer_text = scrolledtext.ScrolledText(
             a_frame,
             height=5,
-            font=('Arial', 10),
-            bg='#1a1a2e',
-            fg='white',
-            insertbackground='white',
-            wrap=tk.WORD,
-            padx=10,
-            pady=10
+            **_PANEL_TEXT
         )
         self.answer_text.grid(row=1, column=0, sticky='nsew')
         
@@ -827,14 +866,14 @@ class FollowUpEditor(BaseDialog):
         self.answer_text.bind('<Return>', self.on_enter)
         
         # Update button
-        update_frame = tk.Frame(editor_frame, bg='#252547')
+        update_frame = tk.Frame(editor_frame, bg=THEME['panel'])
         update_frame.grid(row=5, column=0, sticky='e', padx=15, pady=(0, 12))
         
         self.update_button = tk.Button(
             update_frame,
             text="💾 Update Node",
             command=self.update_node,
-            bg='#00ff88',
+            bg=THEME['success'],
             fg='black',
             font=('Arial', 11, 'bold'),
             padx=20,
@@ -854,34 +893,82 @@ class FollowUpEditor(BaseDialog):
         return 'break'
     
     def setup_action_buttons(self, parent):
-        button_frame = tk.Frame(parent, bg='#1a1a2e')
+        button_frame = tk.Frame(parent, bg=THEME['bg'])
         button_frame.grid(row=2, column=0, columnspan=2, sticky='e', pady=(15, 0))
         
         tk.Button(
             button_frame,
             text="💾 Save Tree",
             command=self.save_tree,
-            bg='#00ff88',
+            bg=THEME['success'],
             fg='black',
-            font=('Arial', 11, 'bold'),
-            padx=25,
-            pady=10
+            **_ACTION_BUTTON
         ).pack(side=tk.RIGHT, padx=(15, 0))
         
         tk.Button(
             button_frame,
             text="❌ Cancel",
             command=self.window.destroy,
-            bg='#ff4d7d',
+            bg=THEME['danger'],
             fg='white',
-            font=('Arial', 11, 'bold'),
-            padx=25,
-            pady=10
+            **_ACTION_BUTTON
         ).pack(side=tk.RIGHT)
     
+    def _add_node(self, parent, branch_name, question="", answer=""):
+        """Record a node in the shadow store; its tree row is created on demand"""
+        node = f"n{next(self._ids)}"
+        self.node_data[node] = {'branch_name': branch_name, 'question': question, 'answer': answer}
+        self.children_of[parent].append(node)
+        self.children_of[node] = []
+        self.parent_of[node] = parent
+        return node
+    
+    def _show(self, parent, node):
+        """Create the tree row for node, with a placeholder child if it has children"""
+        tag = 'root' if parent == '' else 'child'
+        self.tree.insert(parent, 'end', iid=node, text=self.node_data[node]['branch_name'], tags=(tag,))
+        if self.children_of[node]:
+            self.tree.insert(node, 'end', iid=f"{node}.placeholder", text="…", tags=('placeholder',))
+            self._unexpanded.add(node)
+    
+    @property
+    def node_count(self):
+        # The shadow store holds exactly one record per node
+        return len(self.node_data)
+    
+    def _insert(self, parent, branch_name, question="", answer=""):
+        """Add a node to the shadow store and show it in the tree"""
+        node = self._add_node(parent, branch_name, question, answer)
+        self._show(parent, node)
+        return node
+    
+    def _populate(self, node):
+        """Swap node's placeholder row for its real children"""
+        if node not in self._unexpanded:
+            return
+        self._unexpanded.discard(node)
+        self.tree.delete(f"{node}.placeholder")
+        for child in self.children_of[node]:
+            self._show(node, child)
+    
+    def on_tree_open(self, event=None):
+        # Tk focuses the item before generating <<TreeviewOpen>>
+        self._populate(self.tree.focus())
+    
+    def _forget(self, item):
+        """Drop item and everything below it from the shadow store"""
+        self.children_of[self.parent_of[item]].remove(item)
+        stack = [item]
+        while stack:
+            node = stack.pop()
+            del self.node_data[node]
+            del self.parent_of[node]
+            self._unexpanded.discard(node)
+            stack.extend(self.children_of.pop(node))
+    
     def add_root_node(self):
         def save_name(branch_name):
-            item = self.tree.insert('', 'end', text=f"🌱 {branch_name}", values=(branch_name, "", ""))
+            item = self._insert('', branch_name)
             self.tree.selection_set(item)
             self.tree.focus(item)
             self.on_tree_select()
@@ -896,7 +983,8 @@ class FollowUpEditor(BaseDialog):
         
         def save_name(branch_name):
             parent = selected[0]
-            item = self.tree.insert(parent, 'end', text=f"🌿 {branch_name}", values=(branch_name, "", ""))
+            self._populate(parent)
+            item = self._insert(parent, branch_name)
             self.tree.selection_set(item)
             self.tree.focus(item)
             self.on_tree_select()
@@ -908,19 +996,14 @@ class FollowUpEditor(BaseDialog):
         if not self.selected_node:
             return
         
-        current_values = self.tree.item(self.selected_node, 'values')
-        current_name = current_values[0] if current_values else ""
+        current_name = self.node_data[self.selected_node]['branch_name']
         
         def save_name(new_name):
-            current_values = list(self.tree.item(self.selected_node, 'values'))
-            if len(current_values) >= 1:
-                current_values[0] = new_name
-                parent = self.tree.parent(self.selected_node)
-                prefix = "🌱 " if parent == '' else "🌿 "
-                self.tree.item(self.selected_node, text=f"{prefix}{new_name}", values=tuple(current_values))
-                self.on_tree_select()
+            self.tree.item(self.selected_node, text=new_name)
+            self.node_data[self.selected_node]['branch_name'] = new_name
+            self.on_tree_select()
         
-        BranchNameDialog(self.window, current_name, is_root=(self.tree.parent(self.selected_node) == ''), on_save=save_name)
+        BranchNameDialog(self.window, current_name, is_root=(self.parent_of.get(self.selected_node, '') == ''), on_save=save_name)
     
     def on_tree_double_click(self, event):
         item = self.tree.identify('item', event.x, event.y)
@@ -935,60 +1018,81 @@ class FollowUpEditor(BaseDialog):
             messagebox.showwarning("Warning", "Please select a node to delete.")
             return
         
-        node_text = self.tree.item(selected[0], 'text')
-        if messagebox.askyesno("Confirm Delete", 
-                             f"Delete '{node_text}' and all its branches?\nThis cannot be undone."):
-            self.tree.delete(selected[0])
-            self.selected_node = None
-            self.node_title.config(text="No node selected")
-            self.branch_name_display.config(text="Select a node to view details")
-            self.node_info.config(text="Select a node to edit its content")
-            self.delete_button.config(state='disabled')
-            self.edit_name_button.config(state='disabled')
-            self.update_button.config(state='disabled')
-            self.question_text.delete('1.0', tk.END)
-            self.answer_text.delete('1.0', tk.END)
+        item = selected[0]
+        if self._confirm is not None:
+            self._confirm.close()
+        # Ask inline so the event loop keeps running while the user decides
+        self._confirm = InlineConfirm(
+            self.editor_frame,
+            f"Delete '{self.node_data[item]['branch_name']}' and all its branches? This cannot be undone.",
+            on_confirm=lambda: self._do_delete(item),
+            on_cancel=self._confirm_closed
+        )
+    
+    def _confirm_closed(self):
+        self._confirm = None
+    
+    def _do_delete(self, item):
+        self._confirm = None
+        if item not in self.node_data:
+            return
+        self._forget(item)
+        self.tree.delete(item)
+        self.selected_node = None
+        self._clear_editor()
+    
+    def _apply_state(self, enabled, title, info, branch, question='', answer=''):
+        """Push one selection state to the editor panel in a single pass"""
+        if not self._editor_built:
+            if not enabled:
+                return  # Still showing the hint; nothing to clear
+            self._build_editor_panel()
+        state = 'normal' if enabled else 'disabled'
+        self.node_title.configure(text=title)
+        self.node_info.configure(text=info)
+        self.branch_name_display.configure(text=branch)
+        for button in (self.delete_button, self.edit_name_button, self.update_button):
+            button.configure(state=state)
+        _set_text(self.question_text, question)
+        _set_text(self.answer_text, answer)
+    
+    def _clear_editor(self):
+        self._apply_state(False, "No node selected", "Select a node to edit its content",
+                          "Select a node to view details")
     
     def on_tree_select(self, event=None):
+        """Render the selection once Tk is idle so rapid changes collapse into one update"""
+        if event is None:
+            # Called directly after an edit, so redraw even if the node is unchanged
+            self._last_rendered_node = None
+        if self._select_after_id is not None:
+            self.window.after_cancel(self._select_after_id)
+        self._select_after_id = self.window.after_idle(self._do_tree_select)
+    
+    def _do_tree_select(self):
+        self._select_after_id = None
         selected = self.tree.selection()
         if not selected:
+            self._last_rendered_node = None
             self.selected_node = None
-            self.node_title.config(text="No node selected")
-            self.branch_name_display.config(text="Select a node to view details")
-            self.node_info.config(text="Select a node to edit its content")
-            self.delete_button.config(state='disabled')
-            self.edit_name_button.config(state='disabled')
-            self.update_button.config(state='disabled')
-            self.question_text.delete('1.0', tk.END)
-            self.answer_text.delete('1.0', tk.END)
+            self._clear_editor()
+            return
+        
+        if selected[0] == self._last_rendered_node:
             return
+        self._last_rendered_node = selected[0]
         
         self.selected_node = selected[0]
-        item_text = self.tree.item(self.selected_node, 'text')
-        values = self.tree.item(self.selected_node, 'values')
+        record = self.node_data[self.selected_node]
         
-        parent = self.tree.parent(self.selected_node)
+        parent = self.parent_of.get(self.selected_node, '')
         if parent == '':
-            self.node_title.config(text="🗣️ Conversation Starter")
-            self.node_info.config(text="This starts the follow-up conversation")
+            title, info = "🗣️ Conversation Starter", "This starts the follow-up conversation"
         else:
-            self.node_title.config(text="🌿 Conversation Branch")
-            self.node_info.config(text="Continues from previous response")
-        
-        self.delete_button.config(state='normal')
-        self.edit_name_button.config(state='normal')
-        self.update_button.config(state='normal')
-        
-        branch_name = values[0] if values else "Unnamed"
-        self.branch_name_display.config(text=f"Branch: {branch_name}")
-        
-        self.question_text.delete('1.0', tk.END)
-        self.answer_text.delete('1.0', tk.END)
+            title, info = "🌿 Conversation Branch", "Continues from previous response"
         
-        if values and len(values) >= 3:
-            question, answer = values[1], values[2]
-            self.question_text.insert('1.0', question)
-            self.answer_text.insert('1.0', answer)
+        self._apply_state(True, title, info, f"Branch: {record['branch_name']}",
+                          record['question'], record['answer'])
     
     def update_node(self):
         if not self.selected_node:
@@ -1008,69 +1112,59 @@ class FollowUpEditor(BaseDialog):
             self.answer_text.focus_set()
             return
         
-        current_values = list(self.tree.item(self.selected_node, 'values'))
-        branch_name = current_values[0] if current_values else "Unnamed"
+        record = self.node_data[self.selected_node]
+        if record['question'] == question and record['answer'] == answer:
+            messagebox.showinfo("Info", "No changes to save.")
+            return
         
-        parent = self.tree.parent(self.selected_node)
-        prefix = "🌱 " if parent == '' else "🌿 "
-        self.tree.item(self.selected_node, text=f"{prefix}{branch_name}", values=(branch_name, question, answer))
+        # Only the shadow store holds question/answer; the row label is unchanged
+        record.update(question=question, answer=answer)
         
         messagebox.showinfo("Success", "Node updated successfully!")
     
     def load_data(self):
-        def add_children(parent_item, children):
-            for child in children:
-                branch_name = child.get('branch_name', 'Unnamed Branch')
-                question = child.get('question', '')
-                answer = child.get('answer', '')
-                display_text = f"🌿 {branch_name}"
-                item = self.tree.insert(parent_item, 'end', text=display_text, values=(branch_name, question, answer))
-                add_children(item, child.get('children', []))
-        
-        for item in self.followup_data:
-            branch_name = item.get('branch_name', 'Conversation Start')
-            question = item.get('question', '')
-            answer = item.get('answer', '')
-            display_text = f"🌱 {branch_name}"
-            root_item = self.tree.insert('', 'end', text=display_text, values=(branch_name, question, answer))
-            add_children(root_item, item.get('children', []))
+        # Build the shadow store for the whole tree, but only create rows for
+        # the roots; deeper rows are added as their parents are expanded.
+        # Explicit stack of (parent node, remaining children) instead of recursion
+        stack = [('', iter(self.followup_data))]
+        while stack:
+            parent_item, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                continue
+            
+            default_name = 'Conversation Start' if parent_item == '' else 'Unnamed Branch'
+            branch_name = child.get('branch_name', default_name)
+            question = child.get('question', '')
+            answer = child.get('answer', '')
+            item = self._add_node(parent_item, branch_name, question, answer)
+            stack.append((item, iter(child.get('children', []))))
+        
+        for root in self.children_of['']:
+            self._show('', root)
     
     def save_tree(self):
-        def get_children(parent_item):
-            children = []
-            for child_id in self.tree.get_children(parent_item):
-                values = self.tree.item(child_id, 'values')
-                branch_name = values[0] if values else "Unnamed"
-                question = values[1] if len(values) > 1 else ""
-                answer = values[2] if len(values) > 2 else ""
-                children.append({
-                    'branch_name': branch_name,
-                    'question': question,
-                    'answer': answer,
-                    'children': get_children(child_id)
-                })
-            return children
-        
-        followup_data = []
-        for root_id in self.tree.get_children(''):
-            values = self.tree.item(root_id, 'values')
-            branch_name = values[0] if values else "Conversation Start"
-            question = values[1] if len(values) > 1 else ""
-            answer = values[2] if len(values) > 2 else ""
-            followup_data.append({
-                'branch_name': branch_name,
-                'question': question,
-                'answer': answer,
-                'children': get_children(root_id)
-            })
-        
+        # The nested copy is only needed by an on_save consumer
         if self.on_save:
-            self.on_save(followup_data)
+            followup_data = []
+            stack = [('', followup_data)]
+            while stack:
+                parent_item, siblings = stack.pop()
+                for child_id in self.children_of[parent_item]:
+                    node = {**self.node_data[child_id], 'children': []}
+                    siblings.append(node)
+                    stack.append((child_id, node['children']))
+            self.on_save(followup_data, self.node_count)
         
         messagebox.showinfo("Success", "Follow-up tree saved successfully!")
         self.window.destroy()
 
 class GroupEditor(BaseDialog):
+    # Closed editors are hidden here and reused by acquire() instead of rebuilt
+    _pool = []
+    _POOL_SIZE = 2
+    
     def __init__(self, parent, group_data=None, on_save=None):
         super().__init__(parent, "QA Group Editor", 900, 650)
         self.on_save = on_save
@@ -1078,18 +1172,58 @@ class GroupEditor(BaseDialog):
         self.available_topics = ["greeting", "programming", "ai", "gaming", "creative", "thanks", "general"]
         self.followup_data = []
         self.setup_ui()
+        self.window.bind('<Escape>', lambda e: self.close())
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        
+        if group_data:
+            self.load_data()
+    
+    @classmethod
+    def acquire(cls, parent, group_data=None, on_save=None):
+        """Show a pooled editor for group_data, building a new one only if none is free"""
+        while cls._pool:
+            editor = cls._pool.pop()
+            if editor.window.winfo_exists():
+                editor.reset(parent, group_data, on_save)
+                return editor
+        return cls(parent, group_data, on_save)
+    
+    def reset(self, parent, group_data=None, on_save=None):
+        """Repopulate a hidden editor with new group data and show it again"""
+        self.on_save = on_save
+        self.group_data = group_data or {}
+        self.name_var.set("New QA Group")
+        self.desc_var.set("")
+        self.questions_list.delete(0, tk.END)
+        self.answers_list.delete(0, tk.END)
+        self.topic_var.set("greeting")
+        self.priority_var.set("medium")
+        self.followup_data = []
+        self.followup_status.config(text="No follow-up tree defined")
         
         if group_data:
             self.load_data()
+        
+        self.window.deiconify()
+        self.window.grab_set()
+        self.center_window(parent)
+        self.name_entry.focus_set()
+    
+    def close(self):
+        """Hide the editor for reuse, or destroy it if the pool is full"""
+        self.window.grab_release()
+        if len(self._pool) < self._POOL_SIZE:
+            self.window.withdraw()
+            self._pool.append(self)
+        else:
+            self.window.destroy()
     
     def setup_ui(self):
-        self.window.grid_columnconfigure(0, weight=1)
-        self.window.grid_rowconfigure(0, weight=1)
+        _grid(self.window, rows=[1], cols=[1])
         
-        main_frame = tk.Frame(self.window, bg='#1a1a2e')
+        main_frame = tk.Frame(self.window, bg=THEME['bg'])
         main_frame.grid(row=0, column=0, sticky='nsew', padx=15, pady=15)
-        main_frame.grid_columnconfigure(0, weight=1)
-        main_frame.grid_rowconfigure(2, weight=1)
+        _grid(main_frame, rows=[0, 0, 1], cols=[1])
         
         self.setup_header(main_frame).grid(row=0, column=0, sticky='ew', pady=(0, 10))
         self.setup_group_info(main_frame).grid(row=1, column=0, sticky='ew', pady=(0, 10))
@@ -1098,28 +1232,28 @@ class GroupEditor(BaseDialog):
         self.setup_action_buttons(main_frame).grid(row=4, column=0, sticky='e')
     
     def setup_header(self, parent):
-        header = tk.Frame(parent, bg='#1a1a2e')
-        header.grid_columnconfigure(0, weight=1)
+        header = tk.Frame(parent, bg=THEME['bg'])
+        _grid(header, cols=[1])
         
         tk.Label(
             header,
             text="QA Group Editor",
             font=('Arial', 16, 'bold'),
-            bg='#1a1a2e',
+            bg=THEME['bg'],
             fg='white'
         ).grid(row=0, column=0, sticky='w')
         
         return header
     
     def setup_group_info(self, parent):
-        frame = tk.Frame(parent, bg='#252547', relief='raised', bd=1, padx=10, pady=10)
-        frame.grid_columnconfigure(1, weight=1)
+        frame = tk.Frame(parent, bg=THEME['panel'], relief='raised', bd=1, padx=10, pady=10)
+        _grid(frame, cols=[0, 1])
         
         tk.Label(
             frame,
             text="Group Name:",
             font=('Arial', 10, 'bold'),
-            bg='#252547',
+            bg=THEME['panel'],
             fg='white'
         ).grid(row=0, column=0, sticky='w', pady=(0, 8))
         
@@ -1128,7 +1262,7 @@ class GroupEditor(BaseDialog):
             frame,
             textvariable=self.name_var,
             font=('Arial', 10),
-            bg='#2d2d5a',
+            bg=THEME['surface'],
             fg='white',
             insertbackground='white'
         )
@@ -1144,7 +1278,7 @@ class GroupEditor(BaseDialog):
             frame,
             text="Description:",
             font=('Arial', 10, 'bold'),
-            bg='#252547',
+            bg=THEME['panel'],
             fg='white'
         ).grid(row=1, column=0, sticky='w', pady=(0, 8))
         
@@ -1153,7 +1287,7 @@ class GroupEditor(BaseDialog):
             frame,
             textvariable=self.desc_var,
             font=('Arial', 10),
-            bg='#2d2d5a',
+            bg=THEME['surface'],
             fg='white',
             insertbackground='white'
         )
@@ -1163,37 +1297,32 @@ class GroupEditor(BaseDialog):
         return frame
     
     def setup_qa_sections(self, parent):
-        container = tk.Frame(parent, bg='#1a1a2e')
-        container.grid_columnconfigure(0, weight=1)
-        container.grid_columnconfigure(1, weight=1)
-        container.grid_rowconfigure(0, weight=1)
+        container = tk.Frame(parent, bg=THEME['bg'])
+        _grid(container, rows=[1], cols=[1, 1])
         
-        questions_frame = self.create_qa_subsection(container, "Questions", 
-                                                  self.add_question, self.edit_question, self.delete_question)
+        questions_frame, self.questions_list = self.create_qa_subsection(
+            container, "Questions", self.add_question, self.edit_question, self.delete_question)
         questions_frame.grid(row=0, column=0, sticky='nsew', padx=(0, 5))
-        self.questions_list = questions_frame.winfo_children()[1].winfo_children()[0]
         
-        answers_frame = self.create_qa_subsection(container, "Answers",
-                                                self.add_answer, self.edit_answer, self.delete_answer)
+        answers_frame, self.answers_list = self.create_qa_subsection(
+            container, "Answers", self.add_answer, self.edit_answer, self.delete_answer)
         answers_frame.grid(row=0, column=1, sticky='nsew', padx=(5, 0))
-        self.answers_list = answers_frame.winfo_children()[1].winfo_children()[0]
         
         return container
     
     def create_qa_subsection(self, parent, title, add_cmd, edit_cmd, delete_cmd):
-        frame = tk.Frame(parent, bg='#252547', relief='raised', bd=1)
-        frame.grid_columnconfigure(0, weight=1)
-        frame.grid_rowconfigure(1, weight=1)
+        frame = tk.Frame(parent, bg=THEME['panel'], relief='raised', bd=1)
+        _grid(frame, rows=[0, 1], cols=[1])
         
-        header = tk.Frame(frame, bg='#252547')
+        header = tk.Frame(frame, bg=THEME['panel'])
         header.grid(row=0, column=0, sticky='ew', padx=10, pady=8)
-        header.grid_columnconfigure(0, weight=1)
+        _grid(header, cols=[1])
         
         tk.Label(
             header,
             text=title,
             font=('Arial', 12, 'bold'),
-            bg='#252547',
+            bg=THEME['panel'],
             fg='white'
         ).grid(row=0, column=0, sticky='w')
         
@@ -1201,70 +1330,67 @@ class GroupEditor(BaseDialog):
             header,
             text="+ Add",
             command=add_cmd,
-            bg='#6c63ff',
+            bg=THEME['accent'],
             fg='white',
             font=('Arial', 9),
             padx=8
         ).grid(row=0, column=1)
         
-        list_container = tk.Frame(frame, bg='#252547')
+        list_container = tk.Frame(frame, bg=THEME['panel'])
         list_container.grid(row=1, column=0, sticky='nsew', padx=10, pady=(0, 8))
-        list_container.grid_columnconfigure(0, weight=1)
-        list_container.grid_rowconfigure(0, weight=1)
+        _grid(list_container, rows=[1], cols=[1])
         
         listbox = tk.Listbox(
             list_container,
             font=('Arial', 10),
-            bg='#2d2d5a',
+            bg=THEME['surface'],
             fg='white',
-            selectbackground='#6c63ff',
+            selectbackground=THEME['accent'],
             activestyle='none'
         )
         listbox.grid(row=0, column=0, sticky='nsew')
         
         # Use custom scrollbar
         scrollbar = tk.Scrollbar(list_container, orient=tk.VERTICAL, command=listbox.yview,
-                                bg='#2d2d5a', troughcolor='#1a1a2e', activebackground='#6c63ff')
+                                bg=THEME['surface'], troughcolor=THEME['bg'], activebackground=THEME['accent'])
         listbox.config(yscrollcommand=scrollbar.set)
         scrollbar.grid(row=0, column=1, sticky='ns')
         
-        actions = tk.Frame(frame, bg='#252547')
+        actions = tk.Frame(frame, bg=THEME['panel'])
         actions.grid(row=2, column=0, sticky='ew', padx=10, pady=(0, 8))
         
         tk.Button(
             actions,
             text="Edit",
             command=edit_cmd,
-            bg='#00d4ff',
+            bg=THEME['info'],
             fg='black',
-            font=('Arial', 9),
-            width=8
+            **_LIST_BUTTON
         ).pack(side=tk.LEFT, padx=(0, 5))
         
         tk.Button(
             actions,
             text="Delete",
             command=delete_cmd,
-            bg='#ff4d7d',
+            bg=THEME['danger'],
             fg='white',
-            font=('Arial', 9),
-            width=8
+            **_LIST_BUTTON
         ).pack(side=tk.LEFT)
         
-        return frame
+        return frame, listbox
     
     def setup_settings(self, parent):
-        frame = tk.Frame(parent, bg='#252547', relief='raised', bd=1, padx=10, pady=10)
-        frame.grid_columnconfigure(1, weight=1)
+        frame = tk.Frame(parent, bg=THEME['panel'], relief='raised', bd=1, padx=10, pady=10)
+        _grid(frame, cols=[0, 1])
         
-        topic_priority_frame = tk.Frame(frame, bg='#252547')
+        topic_priority_frame = tk.Frame(frame, bg=THEME['panel'])
         topic_priority_frame.grid(row=0, column=0, columnspan=2, sticky='ew', pady=(0, 15))
         
         tk.Label(
             topic_priority_frame,
             text="Topic:",
             font=('Arial', 10, 'bold'),
-            bg='#252547',
+            bg=THEME['panel'],
             fg='white'
         ).pack(side=tk.LEFT, padx=(0, 10))
         
@@ -1282,7 +1408,7 @@ class GroupEditor(BaseDialog):
             topic_priority_frame,
             text="Priority:",
             font=('Arial', 10, 'bold'),
-            bg='#252547',
+            bg=THEME['panel'],
             fg='white'
         ).pack(side=tk.LEFT, padx=(0, 10))
         
@@ -1296,26 +1422,26 @@ class GroupEditor(BaseDialog):
         )
         priority_combo.pack(side=tk.LEFT)
         
-        followup_frame = tk.Frame(frame, bg='#252547')
+        followup_frame = tk.Frame(frame, bg=THEME['panel'])
         followup_frame.grid(row=1, column=0, columnspan=2, sticky='ew', pady=(10, 0))
         
         tk.Label(
             followup_frame,
             text="Follow-up Conversation Tree:",
             font=('Arial', 11, 'bold'),
-            bg='#252547',
+            bg=THEME['panel'],
             fg='white'
         ).pack(anchor='w', pady=(0, 8))
         
-        followup_info = tk.Frame(followup_frame, bg='#252547')
+        followup_info = tk.Frame(followup_frame, bg=THEME['panel'])
         followup_info.pack(fill=tk.X, pady=(0, 8))
         
         self.followup_status = tk.Label(
             followup_info,
             text="No follow-up tree defined",
             font=('Arial', 9),
-            bg='#252547',
-            fg='#b0b0d0'
+            bg=THEME['panel'],
+            fg=THEME['muted']
         )
         self.followup_status.pack(side=tk.LEFT)
         
@@ -1323,7 +1449,7 @@ class GroupEditor(BaseDialog):
             followup_info,
             text="🌳 Edit Follow-up Tree",
             command=self.edit_followup_tree,
-            bg='#6c63ff',
+            bg=THEME['accent'],
             fg='white',
             font=('Arial', 10, 'bold'),
             padx=15,
@@ -1334,8 +1460,8 @@ class GroupEditor(BaseDialog):
             followup_frame,
             text="💡 Create branching conversations that continue after the main answer",
             font=('Arial', 9),
-            bg='#252547',
-            fg='#00d4ff',
+            bg=THEME['panel'],
+            fg=THEME['info'],
             justify=tk.LEFT
         )
         instructions.pack(anchor='w')
@@ -1343,28 +1469,24 @@ class GroupEditor(BaseDialog):
         return frame
     
     def setup_action_buttons(self, parent):
-        frame = tk.Frame(parent, bg='#1a1a2e')
+        frame = tk.Frame(parent, bg=THEME['bg'])
         
         tk.Button(
             frame,
             text="💾 Save Group",
             command=self.save_group,
-            bg='#00ff88',
+            bg=THEME['success'],
             fg='black',
-            font=('Arial', 11, 'bold'),
-            padx=25,
-            pady=10
+            **_ACTION_BUTTON
         ).pack(side=tk.RIGHT, padx=(15, 0))
         
         tk.Button(
             frame,
             text="❌ Cancel",
-            command=self.window.destroy,
-            bg='#ff4d7d',
+            command=self.close,
+            bg=THEME['danger'],
             fg='white',
-            font=('Arial', 11, 'bold'),
-            padx=25,
-            pady=10
+            **_ACTION_BUTTON
         ).pack(side=tk.RIGHT)
         
         return frame
@@ -1422,9 +1544,8 @@ class GroupEditor(BaseDialog):
             self.answers_list.delete(selection[0])
     
     def edit_followup_tree(self):
-        def on_save(followup_data):
+        def on_save(followup_data, total_nodes):
             self.followup_data = followup_data
-            total_nodes = self.count_nodes(followup_data)
             if total_nodes > 0:
                 self.followup_status.config(text=f"Follow-up tree: {total_nodes} conversation nodes")
             else:
@@ -1434,9 +1555,11 @@ class GroupEditor(BaseDialog):
     
     def count_nodes(self, data):
         count = 0
-        for item in data:
-            count += 1
-            count += self.count_nodes(item.get('children', []))
+        stack = [data]
+        while stack:
+            items = stack.pop()
+            count += len(items)
+            stack.extend(item.get('children', []) for item in items)
         return count
     
     def load_data(self):
@@ -1445,11 +1568,14 @@ class GroupEditor(BaseDialog):
         if 'group_description' in self.group_data:
             self.desc_var.set(self.group_data['group_description'])
         
-        for question in self.group_data.get('questions', []):
-            self.questions_list.insert(tk.END, question)
+        # One variadic insert per list instead of one Tcl call per entry
+        questions = self.group_data.get('questions', [])
+        if questions:
+            self.questions_list.insert(tk.END, *questions)
         
-        for answer in self.group_data.get('answers', []):
-            self.answers_list.insert(tk.END, answer)
+        answers = self.group_data.get('answers', [])
+        if answers:
+            self.answers_list.insert(tk.END, *answers)
         
         self.topic_var.set(self.group_data.get('topic', 'greeting'))
         self.priority_var.set(self.group_data.get('priority', 'medium'))
@@ -1480,7 +1606,7 @@ class GroupEditor(BaseDialog):
         if self.on_save:
             self.on_save(group_data)
         
-        self.window.destroy()
+        self.close()
 
 class TrainingGUI:
     def __init__(self, root):
@@ -1488,7 +1614,7 @@ class TrainingGUI:
         self.root.title("Edgar AI Training")
         self.root.geometry("1200x800")
         self.root.minsize(350, 300)
-        self.root.configure(bg='#1a1a2e')
+        self.root.configure(bg=THEME['bg'])
         
         # Initialize backend engine
         self.engine = TrainingEngine()
@@ -1510,6 +1636,7 @@ class TrainingGUI:
         
         self.configure_ttk_styles()
         self.setup_gui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Ensure models folder exists (same as 0.1a)
         os.makedirs("models", exist_ok=True)
@@ -1530,10 +1657,10 @@ class TrainingGUI:
             style.theme_use('default')
         
         style.configure('Dark.TCombobox',
-            background='#2d2d5a',
+            background=THEME['surface'],
             foreground='white',
-            fieldbackground='#2d2d5a',
-            selectbackground='#6c63ff',
+            fieldbackground=THEME['surface'],
+            selectbackground=THEME['accent'],
             selectforeground='white',
             borderwidth=1,
             relief='flat',
@@ -1541,8 +1668,8 @@ class TrainingGUI:
         )
         
         style.map('Dark.TCombobox',
-            fieldbackground=[('readonly', '#2d2d5a')],
-            selectbackground=[('readonly', '#6c63ff')],
+            fieldbackground=[('readonly', THEME['surface'])],
+            selectbackground=[('readonly', THEME['accent'])],
             selectforeground=[('readonly', 'white')]
         )
     
@@ -1552,16 +1679,27 @@ class TrainingGUI:
     
     def create_new_model(self):
         def on_create(name, description, author, version):
+            manager = self.engine.model_manager
             try:
-                self.model_changing = True
-                self.engine.create_model(name, description, author, version)
+                model_data = manager.build_model(name, description, author, version)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to create model: {str(e)}")
+                return
+            
+            def finish(result, error):
+                if error is not None:
+                    self.model_changing = False
+                    messagebox.showerror("Error", f"Failed to create model: {str(error)}")
+                    return
+                manager.add_model(name)
                 self.load_model(name)
                 self.update_model_dropdown()
                 self.model_changing = False
                 messagebox.showinfo("Success", f"Model '{name}' created successfully!")
-            except Exception as e:
-                self.model_changing = False
-                messagebox.showerror("Error", f"Failed to create model: {str(e)}")
+            
+            self.model_changing = True
+            # Only the file write runs on the pool; the model list is updated in finish
+            run_in_background(self.root, manager.background_write(name, model_data), finish)
         
         CreateModelDialog(self.root, on_create)
     
@@ -1574,12 +1712,26 @@ class TrainingGUI:
             model_data = self.engine.model_manager.load_model(self.engine.current_model)
             
             def on_save(description, author, version):
+                manager = self.engine.model_manager
+                name = self.engine.current_model
                 try:
-                    self.engine.update_model_info(description, author, version)
-                    self.update_model_dropdown()
-                    messagebox.showinfo("Success", "Model information updated successfully!")
+                    # Group edits still waiting on the debounce must reach the file first,
+                    # or this snapshot would miss them and the two writes would race
+                    self.engine.flush_pending_save()
+                    # Built from the file on disk here, so the pool only writes it
+                    updated = manager.build_model_info(name, description, author, version)
                 except Exception as e:
                     messagebox.showerror("Error", f"Failed to update model: {str(e)}")
+                    return
+                
+                def finish(result, error):
+                    if error is not None:
+                        messagebox.showerror("Error", f"Failed to update model: {str(error)}")
+                        return
+                    self.update_model_dropdown()
+                    messagebox.showinfo("Success", "Model information updated successfully!")
+                
+                run_in_background(self.root, manager.background_write(name, updated), finish)
             
             EditModelDialog(self.root, model_data, on_save)
         except Exception as e:
@@ -1587,6 +1739,7 @@ class TrainingGUI:
     
     def load_model(self, model_name):
         try:
+            self.engine.flush_pending_save()
             self.engine.load_model(model_name)
             if hasattr(self, 'scroll_frame'):
                 self.refresh_groups()
@@ -1602,6 +1755,22 @@ class TrainingGUI:
             messagebox.showerror("Error", f"Failed to save model: {str(e)}")
             return False
     
+    def schedule_save(self):
+        """Debounced save for group edits; a failed write is reported when it runs"""
+        try:
+            self.engine.schedule_save_current_model(
+                self.root,
+                on_error=lambda e: messagebox.showerror("Error", f"Failed to save model: {str(e)}")
+            )
+            return True
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save model: {str(e)}")
+            return False
+    
+    def on_close(self):
+        self.engine.flush_pending_save()
+        self.root.destroy()
+    
     def on_model_switch_request(self, model_name):
         if self.model_changing:
             return
@@ -1640,7 +1809,7 @@ class TrainingGUI:
         self.root.grid_columnconfigure(0, weight=1)
         self.root.grid_rowconfigure(0, weight=1)
         
-        main_frame = tk.Frame(self.root, bg='#1a1a2e')
+        main_frame = tk.Frame(self.root, bg=THEME['bg'])
         main_frame.grid(row=0, column=0, sticky='nsew', padx=15, pady=15)
         main_frame.grid_columnconfigure(0, weight=1)
         main_frame.grid_rowconfigure(2, weight=1)
@@ -1650,7 +1819,7 @@ class TrainingGUI:
         self.setup_groups_grid(main_frame)
     
     def setup_header(self, parent):
-        header = tk.Frame(parent, bg='#1a1a2e')
+        header = tk.Frame(parent, bg=THEME['bg'])
         header.grid(row=0, column=0, sticky='ew', pady=(0, 15))
         header.grid_columnconfigure(1, weight=1)
         
@@ -1659,18 +1828,18 @@ class TrainingGUI:
             header,
             text="Edgar AI Training",
             font=('Arial', 20, 'bold'),
-            bg='#1a1a2e',
+            bg=THEME['bg'],
             fg='white'
         ).grid(row=0, column=0, sticky='w')
         
         # Model selection area
-        model_frame = tk.Frame(header, bg='#1a1a2e')
+        model_frame = tk.Frame(header, bg=THEME['bg'])
         model_frame.grid(row=0, column=1, sticky='e')
         
         tk.Label(
             model_frame,
             text="Model:",
-            bg='#1a1a2e',
+            bg=THEME['bg'],
             fg='white',
             font=('Arial', 10)
         ).pack(side=tk.LEFT, padx=(0, 5))
@@ -1695,7 +1864,7 @@ class TrainingGUI:
             model_frame,
             text="✏️ Edit",
             command=self.edit_current_model,
-            bg='#00d4ff',
+            bg=THEME['info'],
             fg='black',
             font=('Arial', 9),
             padx=10
@@ -1705,21 +1874,21 @@ class TrainingGUI:
             model_frame,
             text="+ New Model",
             command=self.create_new_model,
-            bg='#6c63ff',
+            bg=THEME['accent'],
             fg='white',
             font=('Arial', 9),
             padx=10
         ).pack(side=tk.LEFT)
         
         # Stats area
-        stats_frame = tk.Frame(header, bg='#1a1a2e')
+        stats_frame = tk.Frame(header, bg=THEME['bg'])
         stats_frame.grid(row=1, column=0, columnspan=2, sticky='w', pady=(10, 0))
         
         self.stats_vars = {}
         stats = [("Groups", "0"), ("Questions", "0"), ("Answers", "0")]
         
         for i, (label, value) in enumerate(stats):
-            frame = tk.Frame(stats_frame, bg='#1a1a2e')
+            frame = tk.Frame(stats_frame, bg=THEME['bg'])
             frame.grid(row=0, column=i, padx=12)
             
             var = tk.StringVar(value=value)
@@ -1727,33 +1896,33 @@ class TrainingGUI:
                 frame,
                 textvariable=var,
                 font=('Arial', 14, 'bold'),
-                bg='#1a1a2e',
-                fg='#6c63ff'
+                bg=THEME['bg'],
+                fg=THEME['accent']
             ).pack()
             
             tk.Label(
                 frame,
                 text=label,
                 font=('Arial', 8),
-                bg='#1a1a2e',
-                fg='#b0b0d0'
+                bg=THEME['bg'],
+                fg=THEME['muted']
             ).pack()
             
             self.stats_vars[label] = var
     
     def setup_toolbar(self, parent):
-        toolbar = tk.Frame(parent, bg='#1a1a2e')
+        toolbar = tk.Frame(parent, bg=THEME['bg'])
         toolbar.grid(row=1, column=0, sticky='ew', pady=(0, 15))
         toolbar.grid_columnconfigure(1, weight=1)
         
         # Search area
-        search_frame = tk.Frame(toolbar, bg='#1a1a2e')
+        search_frame = tk.Frame(toolbar, bg=THEME['bg'])
         search_frame.grid(row=0, column=0, sticky='w')
         
         tk.Label(
             search_frame,
             text="Search:",
-            bg='#1a1a2e',
+            bg=THEME['bg'],
             fg='white',
             font=('Arial', 9)
         ).pack(side=tk.LEFT)
@@ -1763,7 +1932,7 @@ class TrainingGUI:
             search_frame,
             textvariable=self.search_var,
             width=25,
-            bg='#2d2d5a',
+            bg=THEME['surface'],
             fg='white',
             insertbackground='white',
             font=('Arial', 9)
@@ -1774,7 +1943,7 @@ class TrainingGUI:
         tk.Label(
             search_frame,
             text="Filter:",
-            bg='#1a1a2e',
+            bg=THEME['bg'],
             fg='white',
             font=('Arial', 9)
         ).pack(side=tk.LEFT, padx=(0, 5))
@@ -1795,14 +1964,14 @@ class TrainingGUI:
         self.search_mode.trace('w', self.on_search)
         
         # Action buttons
-        actions = tk.Frame(toolbar, bg='#1a1a2e')
+        actions = tk.Frame(toolbar, bg=THEME['bg'])
         actions.grid(row=0, column=1, sticky='e')
         
         tk.Button(
             actions,
             text="Import JSON",
             command=self.import_json,
-            bg='#6c63ff',
+            bg=THEME['accent'],
             fg='white',
             font=('Arial', 9),
             padx=12
@@ -1812,7 +1981,7 @@ class TrainingGUI:
             actions,
             text="Export JSON",
             command=self.export_json,
-            bg='#00d4ff',
+            bg=THEME['info'],
             fg='black',
             font=('Arial', 9),
             padx=12
@@ -1822,7 +1991,7 @@ class TrainingGUI:
             actions,
             text="+ New Group",
             command=self.new_group,
-            bg='#00ff88',
+            bg=THEME['success'],
             fg='black',
             font=('Arial', 10, 'bold'),
             padx=15
@@ -1830,26 +1999,26 @@ class TrainingGUI:
     
     def setup_groups_grid(self, parent):
         """Setup responsive groups display with dynamic column layout"""
-        container = tk.Frame(parent, bg='#1a1a2e')
+        container = tk.Frame(parent, bg=THEME['bg'])
         container.grid(row=2, column=0, sticky='nsew')
         container.grid_columnconfigure(0, weight=1)
         container.grid_rowconfigure(0, weight=1)
         
-        self.canvas = tk.Canvas(container, bg='#1a1a2e', highlightthickness=0)
+        self.canvas = tk.Canvas(container, bg=THEME['bg'], highlightthickness=0)
         
         # Use custom scrollbar with theme colors
         self.scrollbar = tk.Scrollbar(
             container, 
             orient=tk.VERTICAL, 
             command=self.canvas.yview,
-            bg='#2d2d5a', 
-            troughcolor='#1a1a2e', 
-            activebackground='#6c63ff',
+            bg=THEME['surface'], 
+            troughcolor=THEME['bg'], 
+            activebackground=THEME['accent'],
             width=16
         )
         
         # Main scrollable frame
-        self.scroll_frame = tk.Frame(self.canvas, bg='#1a1a2e')
+        self.scroll_frame = tk.Frame(self.canvas, bg=THEME['bg'])
         self.scroll_frame.bind(
             "<Configure>",
             lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
@@ -1862,7 +2031,7 @@ class TrainingGUI:
         self.scrollbar.grid(row=0, column=1, sticky='ns')
         
         # Groups container inside scroll frame
-        self.groups_container = tk.Frame(self.scroll_frame, bg='#1a1a2e')
+        self.groups_container = tk.Frame(self.scroll_frame, bg=THEME['bg'])
         self.groups_container.pack(fill='both', expand=True, padx=10, pady=10)
         
         # Bind resize event for responsive layout
@@ -2023,7 +2192,7 @@ class TrainingGUI:
         """Create a modern group card widget with improved layout"""
         card = tk.Frame(
             self.groups_container, 
-            bg='#252547', 
+            bg=THEME['panel'], 
             relief='raised', 
             bd=1,
             width=self.min_card_width,
@@ -2032,11 +2201,11 @@ class TrainingGUI:
         card.pack_propagate(False)
         
         # Main content with padding
-        content = tk.Frame(card, bg='#252547')
+        content = tk.Frame(card, bg=THEME['panel'])
         content.pack(fill='both', expand=True, padx=12, pady=12)
         
         # Header with title and badge
-        header = tk.Frame(content, bg='#252547')
+        header = tk.Frame(content, bg=THEME['panel'])
         header.pack(fill='x', pady=(0, 8))
         
         # Topic badge
@@ -2062,7 +2231,7 @@ class TrainingGUI:
             header,
             text="●",
             font=('Arial', 12),
-            bg='#252547',
+            bg=THEME['panel'],
             fg=priority_color
         )
         priority_dot.pack(side='right', padx=(5, 0))
@@ -2072,14 +2241,14 @@ class TrainingGUI:
         if len(group_name) > 25:
             group_name = group_name[:22] + "..."
         
-        name_frame = tk.Frame(content, bg='#252547')
+        name_frame = tk.Frame(content, bg=THEME['panel'])
         name_frame.pack(fill='x', pady=(0, 6))
         
         name_label = tk.Label(
             name_frame,
             text=group_name,
             font=('Arial', 13, 'bold'),
-            bg='#252547',
+            bg=THEME['panel'],
             fg='white',
             anchor='center'
         )
@@ -2095,8 +2264,8 @@ class TrainingGUI:
                 content,
                 text=desc,
                 font=('Arial', 9),
-                bg='#252547',
-                fg='#b0b0d0',
+                bg=THEME['panel'],
+                fg=THEME['muted'],
                 anchor='w',
                 wraplength=240,
                 justify=tk.LEFT
@@ -2104,7 +2273,7 @@ class TrainingGUI:
             desc_label.pack(fill='x', pady=(0, 8))
         
         # Stats bar
-        stats_frame = tk.Frame(content, bg='#252547')
+        stats_frame = tk.Frame(content, bg=THEME['panel'])
         stats_frame.pack(fill='x', side='bottom')
         
         # Questions count
@@ -2118,14 +2287,14 @@ class TrainingGUI:
             stats_frame,
             text=stats_text,
             font=('Arial', 10, 'bold'),
-            bg='#252547',
-            fg='#b0b0d0',
+            bg=THEME['panel'],
+            fg=THEME['muted'],
             anchor='center'
         )
         stats_label.pack(fill='x')
         
         # Action buttons (centered at bottom)
-        actions = tk.Frame(content, bg='#252547')
+        actions = tk.Frame(content, bg=THEME['panel'])
         actions.pack(fill='x', side='bottom', pady=(8, 0))
         
         # Store group reference for callbacks
@@ -2135,7 +2304,7 @@ class TrainingGUI:
             actions,
             text="✏️ Edit",
             command=lambda: self.edit_group(self.engine.get_qa_groups().index(group_ref)),
-            bg='#6c63ff',
+            bg=THEME['accent'],
             fg='white',
             font=('Arial', 9, 'bold'),
             padx=12,
@@ -2148,7 +2317,7 @@ class TrainingGUI:
             actions,
             text="🗑️ Delete",
             command=lambda: self.delete_group(self.engine.get_qa_groups().index(group_ref)),
-            bg='#ff4d7d',
+            bg=THEME['danger'],
             fg='white',
             font=('Arial', 9, 'bold'),
             padx=12,
@@ -2188,10 +2357,10 @@ class TrainingGUI:
             
         def on_save(group_data):
             self.engine.add_qa_group(group_data)
-            if self.save_current_model():
+            if self.schedule_save():
                 self.refresh_groups()
         
-        GroupEditor(self.root, on_save=on_save)
+        GroupEditor.acquire(self.root, on_save=on_save)
     
     def edit_group(self, index):
         if not self.engine.current_model:
@@ -2200,10 +2369,10 @@ class TrainingGUI:
             
         def on_save(group_data):
             self.engine.update_qa_group(index, group_data)
-            if self.save_current_model():
+            if self.schedule_save():
                 self.refresh_groups()
         
-        GroupEditor(self.root, self.engine.get_qa_groups()[index], on_save)
+        GroupEditor.acquire(self.root, self.engine.get_qa_groups()[index], on_save)
     
     def delete_group(self, index):
         if not self.engine.current_model:
@@ -2212,7 +2381,7 @@ class TrainingGUI:
             
         if messagebox.askyesno("Confirm", "Delete this group?"):
             self.engine.delete_qa_group(index)
-            if self.save_current_model():
+            if self.schedule_save():
                 self.refresh_groups()
     
     def import_json(self):
@@ -2220,6 +2389,7 @@ class TrainingGUI:
             messagebox.showwarning("Warning", "Please create or select a model first.")
             return
             
+        from tkinter import filedialog
         filename = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
         if filename:
             try:
@@ -2246,6 +2416,7 @@ class TrainingGUI:
         else:
             default_filename = f"export_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
+        from tkinter import filedialog
         filename = filedialog.asksaveasfilename(
             defaultextension=".json",
             filetypes=[("JSON files", "*.json")],